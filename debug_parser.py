@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Debug script for SVRF parser"""
 
-from svrf_drc_parser import SVRFLexer, SVRFParser
+from svrf_drc_parser import SVRFLexer, SVRFParser, TokenType
 
 # Test with a simple SVRF snippet
 test_content = """
@@ -33,34 +33,43 @@ print(f"Token count: {len(parser.tokens)}")
 step_count = 0
 max_steps = 50
 
+# Bind the token types and parser methods used by the step loop once
+EOF, LAYER, IDENTIFIER = TokenType.EOF, TokenType.LAYER, TokenType.IDENTIFIER
+advance = parser.advance
+skip_newlines = parser.skip_newlines
+skip_comments = parser.skip_comments
+
 try:
-    while parser.current_token and parser.current_token.type.value != "EOF" and step_count < max_steps:
-        print(f"Step {step_count}: Current token = {parser.current_token.type.value} '{parser.current_token.value}'")
+    tok = parser.current_token
+    while tok and tok.type is not EOF and step_count < max_steps:
+        print(f"Step {step_count}: Current token = {tok.type.value} '{tok.value}'")
         
         old_pos = parser.pos
         
-        parser.skip_newlines()
-        parser.skip_comments()
+        skip_newlines()
+        skip_comments()
         
-        if not parser.current_token or parser.current_token.type.value == "EOF":
+        tok = parser.current_token
+        if not tok or tok.type is EOF:
             break
         
-        if parser.current_token.type.value == "LAYER":
+        if tok.type is LAYER:
             print("  Parsing layer definition...")
             parser.parse_layer_definition()
-        elif parser.current_token.type.value == "IDENTIFIER":
+        elif tok.type is IDENTIFIER:
             print("  Parsing DRC rule...")
             parser.parse_drc_rule()
         else:
             print("  Advancing...")
-            parser.advance()
+            advance()
         
         # Safety check - ensure we made progress
         if parser.pos == old_pos:
             print(f"  WARNING: No progress made at position {parser.pos}")
-            parser.advance()
+            advance()
         
         step_count += 1
+        tok = parser.current_token
     
     print(f"Finished parsing in {step_count} steps")
     print(f"Final layers: {len(parser.layers)}")
@@ -3,6 +3,10 @@
 Demo script for SVRF DRC Parser capabilities
 """
 
+import io
+import sys
+from contextlib import redirect_stdout
+from itertools import islice
 from simple_svrf_parser import SVRFParser
 
 def demo_parser():
@@ -44,8 +48,10 @@ def demo_parser():
     layer_names = {layer.name for layer in parser.layers if layer.gds_number is not None}
     rule_layers = {rule.layer for rule in parser.rules if rule.layer}
     
-    covered_layers = layer_names.intersection(rule_layers)
-    uncovered_layers = layer_names - rule_layers
+    # covered_layers is a subset of rule_layers, so the difference probes
+    # the smaller set
+    covered_layers = layer_names & rule_layers
+    uncovered_layers = layer_names - covered_layers
     
     print(f"  Layers with rules: {len(covered_layers)}/{len(layer_names)}")
     print(f"  Covered: {sorted(covered_layers)}")
@@ -57,9 +63,16 @@ def demo_parser():
         print(f"  {rule_type.capitalize()}: {count}")
     
     print(f"\nStrictest Rules (< 0.2):")
-    strict_rules = [r for r in parser.rules if r.value < 0.2 and r.operator == '<']
-    for rule in strict_rules[:5]:
+    # Stop scanning as soon as the five rules to display have been found
+    strict_rules = (r for r in parser.rules if r.operator == '<' and r.value < 0.2)
+    for rule in islice(strict_rules, 5):
         print(f"  {rule.name}: {rule.layer} < {rule.value}")
 
 if __name__ == "__main__":
-    demo_parser()
\ No newline at end of file
+    # Buffer the demo output and write it out once
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            demo_parser()
+    finally:
+        sys.stdout.write(buf.getvalue())
\ No newline at end of file
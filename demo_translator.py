@@ -4,7 +4,10 @@ Demo script for SVRF to ICV Translator
 """
 
 from svrf_to_icv_translator import SVRFToICVTranslator
-from pathlib import Path
+import io
+import os
+import sys
+from contextlib import redirect_stdout
 
 def demo_translator():
     print("=== SVRF to ICV Translator Demo ===\n")
@@ -52,19 +55,22 @@ def demo_translator():
     print("\n\n3. LAYER TRANSLATIONS")
     print("=" * 50)
     
+    # Classify each layer definition once: a GDS number on the right-hand
+    # side marks a primary layer, anything else is a derived expression
+    primary_defs, derived_defs = [], []
+    for layer_def in translator.icv_layers:
+        if "=" not in layer_def:
+            continue
+        rhs = layer_def.rpartition("=")[2].strip(" ;\n")
+        (primary_defs if rhs.isdigit() else derived_defs).append(layer_def)
+    
     print("Primary Layers (GDS):")
-    for i, layer_def in enumerate(translator.icv_layers):
-        if "=" in layer_def and layer_def.split("=")[1].strip().rstrip(";").isdigit():
-            print(f"  {layer_def}")
-            if i >= 4:  # Show first 5
-                break
+    for layer_def in primary_defs[:5]:  # Show first 5
+        print(f"  {layer_def}")
     
     print("\nDerived Layers (Boolean):")
-    for i, layer_def in enumerate(translator.icv_layers):
-        if "=" in layer_def and not layer_def.split("=")[1].strip().rstrip(";").isdigit():
-            print(f"  {layer_def}")
-            if i >= 3:  # Show first 4
-                break
+    for layer_def in derived_defs[:4]:  # Show first 4
+        print(f"  {layer_def}")
     
     # Show syntax comparison
     print("\n\n4. SYNTAX COMPARISON EXAMPLES")
@@ -107,22 +113,31 @@ def demo_translator():
     print(f"\n\n5. OUTPUT FILE ANALYSIS")
     print("=" * 50)
     
-    output_path = Path(output_file)
-    if output_path.exists():
+    # One stat() call answers both "does it exist" and "how big is it"
+    try:
+        output_size = os.stat(output_file).st_size
+    except FileNotFoundError:
+        output_size = None
+    
+    if output_size is not None:
+        # Count line categories in one streaming pass over the file
+        total_lines = comment_lines = rule_lines = layer_lines = 0
         with open(output_file, 'r') as f:
-            lines = f.readlines()
-        
-        total_lines = len(lines)
-        comment_lines = len([l for l in lines if l.strip().startswith('//')])
-        rule_lines = len([l for l in lines if 'rule ' in l])
-        layer_lines = len([l for l in lines if l.startswith('LAYER ')])
+            for line in f:
+                total_lines += 1
+                if line.lstrip().startswith('//'):
+                    comment_lines += 1
+                if 'rule ' in line:
+                    rule_lines += 1
+                if line.startswith('LAYER '):
+                    layer_lines += 1
         
         print(f"Output File: {output_file}")
         print(f"  Total Lines: {total_lines}")
         print(f"  Comment Lines: {comment_lines}")
         print(f"  Rule Definitions: {rule_lines}")
         print(f"  Layer Definitions: {layer_lines}")
-        print(f"  File Size: {output_path.stat().st_size} bytes")
+        print(f"  File Size: {output_size} bytes")
     
     print(f"\n\n6. KEY TRANSLATION FEATURES")
     print("=" * 50)
@@ -138,4 +153,10 @@ def demo_translator():
     print(f"\n\nTranslation completed! Check '{output_file}' for full ICV rules.")
 
 if __name__ == "__main__":
-    demo_translator()
\ No newline at end of file
+    # Print the whole demo with one write at the end
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            demo_translator()
+    finally:
+        sys.stdout.write(buf.getvalue())
\ No newline at end of file
@@ -6,18 +6,23 @@ Handles all complex SVRF constructs including enclosure, antenna, and pattern ma
 
 import re
 import sys
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
-@dataclass
+# Layer and DRCRule are slotted where dataclasses support it (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Layer:
     name: str
     gds_number: Optional[int] = None
     expression: Optional[str] = None
     line_number: int = 0
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DRCRule:
     name: str
     description: str
@@ -31,6 +36,178 @@ class DRCRule:
     antenna_params: Dict[str, Any] = None  # For antenna rules
     pattern_params: Dict[str, Any] = None  # For pattern matching rules
 
+# Enhanced rule patterns for 100% coverage, as (pattern, category).
+# Order matters: the first pattern that matches a rule wins.
+_RAW_PATTERNS = [
+    # Standard patterns (existing)
+    (r'(INTERNAL1)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'width'),
+    (r'(INTERNAL2)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'length'),
+    (r'(EXTERNAL1)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'spacing'),
+    (r'(EXTERNAL)\s+(\w+)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'inter_spacing'),
+    (r'(AREA)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'area'),
+    (r'(DENSITY)\s+(\w+)\s+WINDOW\s+([\d.]+)\s+([\d.]+)\s*(<|>|==)\s*([\d.]+)', 'density'),
+    (r'(DENSITY)\s+(\w+)\s+WINDOW\s+([\d.]+)\s+([\d.]+)\s*(<|>)\s*([\d.]+)', 'density_simple'),
+    
+    # Enclosure patterns (NEW). The \b keeps the leading \w+ from being
+    # retried at every character inside a word, which is quadratic in the
+    # word length; a match can only start at a word boundary anyway.
+    (r'\b(\w+)\s+NOT\s+INSIDE\s+(\w+)\s+BY\s*(>=|==|<=)\s*([\d.]+)', 'enclosure'),
+    
+    # Antenna patterns (NEW)
+    (r'ANTENNA\s+(\w+)\s+(\w+)\s+MAX\s+RATIO\s+([\d.]+)', 'antenna_ratio'),
+    
+    # Pattern matching (NEW)
+    (r'RECTANGLE\s+(\w+)\s+LENGTH\s*([<>=]+)\s*([\d.]+)\s+WIDTH\s*([<>=]+)\s*([\d.]+)', 'rectangle'),
+    
+    # Same mask patterns (NEW)
+    (r'(EXTERNAL1)\s+(\w+)\s*(<|>|==)\s*([\d.]+)\s+SAME_MASK', 'same_mask_spacing'),
+    
+    # Advanced constraints (NEW)
+    (r'(INTERNAL1)\s+(\w+)\s*(<|>|==)\s*([\d.]+)\s+OPPOSITE', 'opposite_constraint'),
+]
+
+# Keyword each category's pattern needs literally; a rule body without it
+# cannot match that category
+_CATEGORY_KEYWORDS = {
+    'width': 'INTERNAL1',
+    'length': 'INTERNAL2',
+    'spacing': 'EXTERNAL1',
+    'inter_spacing': 'EXTERNAL',
+    'area': 'AREA',
+    'density': 'DENSITY',
+    'density_simple': 'DENSITY',
+    'enclosure': 'INSIDE',
+    'antenna_ratio': 'ANTENNA',
+    'rectangle': 'RECTANGLE',
+    'same_mask_spacing': 'SAME_MASK',
+    'opposite_constraint': 'OPPOSITE',
+}
+
+# Compiled rule patterns as (category, keyword, regex), in _RAW_PATTERNS order.
+# They are case-sensitive and run against an upper-cased copy of the rule
+# body, which is cheaper than IGNORECASE.
+_RULE_PATTERNS = tuple((category, _CATEGORY_KEYWORDS[category], re.compile(pattern))
+                       for pattern, category in _RAW_PATTERNS)
+
+# Fallback for bodies whose upper-cased copy changes length (e.g. 'ß')
+_RULE_PATTERNS_ANYCASE = tuple((category, re.compile(pattern, re.IGNORECASE))
+                               for pattern, category in _RAW_PATTERNS)
+
+@lru_cache(maxsize=1024)
+def _to_float(text):
+    """float() for rule values; decks reuse a handful of thresholds"""
+    return float(text)
+
+# Categories that map straight onto DRCRule fields: category ->
+# (rule_type, layer group, operator group, value group, extra_params groups)
+_CATEGORY_FIELDS = {
+    'width': ('internal1', 2, 3, 4, ()),
+    'length': ('internal2', 2, 3, 4, ()),
+    'spacing': ('external1', 2, 3, 4, ()),
+    'inter_spacing': ('external', 2, 4, 5, (3,)),  # Second layer
+    'area': ('area', 2, 3, 4, ()),
+    'density': ('density', 2, 5, 6, (3, 4)),  # Window dimensions
+    'density_simple': ('density', 2, 5, 6, (3, 4)),
+}
+
+def _enclosure_fields(groups):
+    return {
+        'rule_type': "enclosure",
+        'layer': groups[1],  # Inner layer
+        'enclosure_layers': [groups[2]],  # Outer layer
+        'operator': groups[3],
+        'value': _to_float(groups[4]),
+    }
+
+def _antenna_fields(groups):
+    max_ratio = _to_float(groups[3])
+    return {
+        'rule_type': "antenna",
+        'layer': groups[1],  # Metal layer
+        'antenna_params': {
+            'gate_layer': groups[2],
+            'max_ratio': max_ratio
+        },
+        'operator': "MAX_RATIO",
+        'value': max_ratio,
+    }
+
+def _rectangle_fields(groups):
+    return {
+        'rule_type': "pattern_matching",
+        'layer': groups[1],
+        'pattern_params': {
+            'type': 'rectangle',
+            'length_op': groups[2],
+            'length_val': _to_float(groups[3]),
+            'width_op': groups[4],
+            'width_val': _to_float(groups[5])
+        },
+        'operator': "RECTANGLE",
+        'value': 0.0,
+    }
+
+def _same_mask_fields(groups):
+    return {
+        'rule_type': "multi_patterning",
+        'layer': groups[2],
+        'operator': groups[3],
+        'value': _to_float(groups[4]),
+        'extra_params': ['SAME_MASK'],
+    }
+
+def _opposite_fields(groups):
+    return {
+        'rule_type': "advanced_constraint",
+        'layer': groups[2],
+        'operator': groups[3],
+        'value': _to_float(groups[4]),
+        'extra_params': ['OPPOSITE'],
+    }
+
+# Category -> handler returning the DRCRule fields for the matched groups.
+# Categories that need more than a field mapping have their own handler.
+_CATEGORY_HANDLERS = {
+    'enclosure': _enclosure_fields,
+    'antenna_ratio': _antenna_fields,
+    'rectangle': _rectangle_fields,
+    'same_mask_spacing': _same_mask_fields,
+    'opposite_constraint': _opposite_fields,
+}
+
+def _simple_fields(rule_type, layer_group, operator_group, value_group, extra_groups):
+    """Build a handler with one _CATEGORY_FIELDS entry baked in"""
+    if extra_groups:
+        def fields(groups):
+            return {
+                'rule_type': rule_type,
+                'layer': groups[layer_group],
+                'operator': groups[operator_group],
+                'value': _to_float(groups[value_group]),
+                'extra_params': [groups[g] for g in extra_groups],
+            }
+    else:
+        def fields(groups):
+            return {
+                'rule_type': rule_type,
+                'layer': groups[layer_group],
+                'operator': groups[operator_group],
+                'value': _to_float(groups[value_group]),
+            }
+    return fields
+
+# Specialize the table-driven categories at import, so extraction is a single
+# handler lookup and call for every category
+_CATEGORY_HANDLERS.update((category, _simple_fields(*info))
+                          for category, info in _CATEGORY_FIELDS.items())
+
+# Rule qualifiers recorded in extra_params, found in one scan of the rule body
+_QUALIFIER_KEYWORDS = ('SINGULAR', 'SAME_MASK', 'OPPOSITE')
+_KEYWORDS_RE = re.compile(r'\b(?:%s)\b' % '|'.join(_QUALIFIER_KEYWORDS))
+
+_DESC_RE = re.compile(r'@\s*"([^"]+)"')
+_INCLUDE_RE = re.compile(r'INCLUDE\s+"([^"]+)"')
+
 class EnhancedSVRFParser:
     """Enhanced SVRF parser with complete rule coverage"""
     
@@ -40,85 +217,67 @@ class EnhancedSVRFParser:
         self.includes = []
         self.errors = []
         
-        # Enhanced rule patterns for 100% coverage
-        self.enhanced_patterns = [
-            # Standard patterns (existing)
-            (r'(INTERNAL1)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'width'),
-            (r'(INTERNAL2)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'length'),
-            (r'(EXTERNAL1)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'spacing'),
-            (r'(EXTERNAL)\s+(\w+)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'inter_spacing'),
-            (r'(AREA)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'area'),
-            (r'(DENSITY)\s+(\w+)\s+WINDOW\s+([\d.]+)\s+([\d.]+)\s*(<|>|==)\s*([\d.]+)', 'density'),
-            (r'(DENSITY)\s+(\w+)\s+WINDOW\s+([\d.]+)\s+([\d.]+)\s*(<|>)\s*([\d.]+)', 'density_simple'),
-            
-            # Enclosure patterns (NEW)
-            (r'(\w+)\s+NOT\s+INSIDE\s+(\w+)\s+BY\s*(>=|==|<=)\s*([\d.]+)', 'enclosure'),
-            
-            # Antenna patterns (NEW)
-            (r'ANTENNA\s+(\w+)\s+(\w+)\s+MAX\s+RATIO\s+([\d.]+)', 'antenna_ratio'),
-            
-            # Pattern matching (NEW)
-            (r'RECTANGLE\s+(\w+)\s+LENGTH\s*([<>=]+)\s*([\d.]+)\s+WIDTH\s*([<>=]+)\s*([\d.]+)', 'rectangle'),
-            
-            # Same mask patterns (NEW)
-            (r'(EXTERNAL1)\s+(\w+)\s*(<|>|==)\s*([\d.]+)\s+SAME_MASK', 'same_mask_spacing'),
-            
-            # Advanced constraints (NEW)
-            (r'(INTERNAL1)\s+(\w+)\s*(<|>|==)\s*([\d.]+)\s+OPPOSITE', 'opposite_constraint'),
-        ]
+        # Handlers for keyword statements, keyed by their first five characters
+        self.statement_handlers = {
+            'INCLU': ('INCLUDE', self.parse_include),
+            'LAYOU': ('LAYOUT', None),  # Skip layout declarations
+            'LAYER': ('LAYER', self.parse_layer_definition),
+        }
     
     def parse_file(self, filename: str):
         """Parse SVRF file from disk"""
         try:
-            with open(filename, 'r') as f:
-                lines = f.readlines()
+            f = open(filename, 'r')
         except FileNotFoundError:
             self.errors.append(f"File not found: {filename}")
             return
         
-        self.parse_lines(lines)
+        # Stream the file so only the current rule block is held in memory
+        with f:
+            self.parse_lines(f)
     
-    def parse_lines(self, lines: List[str]):
+    def parse_lines(self, lines: Iterable[str]):
         """Parse lines of SVRF content with enhanced rule detection"""
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            line_num = i + 1
+        self.rules.extend(self.iter_parse(lines))
+    
+    def iter_parse(self, lines: Iterable[str]) -> Iterator[DRCRule]:
+        """Parse lines of SVRF content, yielding each DRC rule as soon as it is parsed
+        
+        Layers, includes and errors are still collected on the parser.
+        """
+        numbered = enumerate(lines, 1)
+        # One line of lookahead: a rule name may sit on the line before its '{'
+        pending = next(numbered, None)
+        
+        while pending is not None:
+            line_num, line = pending
+            line = line.strip()
+            pending = next(numbered, None)
             
             # Skip empty lines and comments
             if not line or line.startswith('//'):
-                i += 1
                 continue
             
-            try:
-                # INCLUDE statements
-                if line.startswith('INCLUDE'):
-                    self.parse_include(line, line_num)
-                
-                # LAYOUT statements
-                elif line.startswith('LAYOUT'):
-                    pass  # Skip layout declarations
-                
-                # Layer definitions
-                elif line.startswith('LAYER'):
-                    self.parse_layer_definition(line, line_num)
-                
-                # Derived layer assignments (LAYER_NAME = expression)
-                elif '=' in line and not line.startswith('    ') and '{' not in line:
-                    self.parse_derived_layer(line, line_num)
-                
-                # DRC rules (identifier followed by {)
-                elif '{' in line or (i + 1 < len(lines) and '{' in lines[i + 1]):
-                    i = self.parse_enhanced_drc_rule(lines, i, line_num)
-                
-            except Exception as e:
-                self.errors.append(f"Error parsing line {line_num}: {e}")
+            # INCLUDE, LAYOUT and LAYER statements
+            statement = self.statement_handlers.get(line[:5])
+            if statement is not None and line.startswith(statement[0]):
+                handler = statement[1]
+                if handler is not None:
+                    handler(line, line_num)
+            
+            # Derived layer assignments (LAYER_NAME = expression)
+            elif '=' in line and not line.startswith('    ') and '{' not in line:
+                self.parse_derived_layer(line, line_num)
             
-            i += 1
+            # DRC rules (identifier followed by {)
+            elif '{' in line or (pending is not None and '{' in pending[1]):
+                rule, pending = self.parse_enhanced_drc_rule(line, pending, numbered, line_num)
+                if rule is not None:
+                    yield rule
     
     def parse_include(self, line: str, line_num: int):
         """Parse INCLUDE statement"""
-        match = re.search(r'INCLUDE\s+"([^"]+)"', line)
+        match = _INCLUDE_RE.search(line)
         if match:
             self.includes.append(match.group(1))
     
@@ -127,7 +286,11 @@ class EnhancedSVRFParser:
         parts = line.split()
         if len(parts) >= 3 and parts[0] == 'LAYER':
             layer_name = parts[1]
-            gds_number = int(parts[2])
+            try:
+                gds_number = int(parts[2])
+            except ValueError as e:
+                self.errors.append(f"Error parsing line {line_num}: {e}")
+                return
             self.layers.append(Layer(layer_name, gds_number=gds_number, line_number=line_num))
     
     def parse_derived_layer(self, line: str, line_num: int):
@@ -139,197 +302,158 @@ class EnhancedSVRFParser:
                 expression = parts[1].strip()
                 self.layers.append(Layer(layer_name, expression=expression, line_number=line_num))
     
-    def parse_enhanced_drc_rule(self, lines: List[str], start_idx: int, line_num: int):
-        """Enhanced DRC rule parsing with complete pattern support"""
-        line = lines[start_idx].strip()
+    def parse_enhanced_drc_rule(self, line: str, pending: Optional[Tuple[int, str]],
+                                numbered: Iterator[Tuple[int, str]], line_num: int):
+        """Enhanced DRC rule parsing with complete pattern support
         
+        Reads the rule block starting at line, pulling further lines from
+        numbered, an iterator of (line_num, line) positioned after pending.
+        Returns (rule, pending): the parsed DRCRule, or None if it failed to
+        parse, and the next unconsumed (line_num, line), or None at EOF. The
+        rule is not appended to self.rules; iter_parse yields it.
+        """
         # Handle case where rule name and { are on same line or separate lines
         if '{' in line:
             rule_name = line.split('{')[0].strip()
-            start_brace_line = start_idx
+            single_line = line.count('{') == line.count('}')
         else:
-            rule_name = line.strip()
-            start_brace_line = start_idx + 1
-        
-        # Find the complete rule block
-        rule_lines = []
-        brace_count = 0
-        i = start_idx
-        found_opening_brace = False
+            rule_name = line
+            single_line = False
         
-        while i < len(lines):
-            current_line = lines[i].strip()
-            if current_line:  # Skip empty lines
-                rule_lines.append(current_line)
-            
-            # Count braces to find end of rule
-            open_braces = current_line.count('{')
-            close_braces = current_line.count('}')
-            
-            if open_braces > 0:
-                found_opening_brace = True
-            
-            brace_count += open_braces - close_braces
+        if single_line:
+            # Fast path: the whole rule sits on one line, "NAME { ... }"
+            rule_content = line
+        else:
+            # Find the complete rule block, pulling lines from the stream
+            rule_lines = []
+            brace_count = 0
+            found_opening_brace = False
+            current_line = line
             
-            # If we found the opening brace and count is back to 0, we're done
-            if found_opening_brace and brace_count == 0:
-                break
+            while True:
+                if current_line:  # Skip empty lines
+                    rule_lines.append(current_line)
+                
+                # Count braces to find end of rule; brace-free lines cannot close it
+                if '{' in current_line or '}' in current_line:
+                    open_braces = current_line.count('{')
+                    close_braces = current_line.count('}')
+                    
+                    if open_braces > 0:
+                        found_opening_brace = True
+                    
+                    brace_count += open_braces - close_braces
+                    
+                    # If we found the opening brace and count is back to 0, we're done
+                    if found_opening_brace and brace_count == 0:
+                        break
+                
+                if pending is None:
+                    break
+                
+                current_line = pending[1].strip()
+                pending = next(numbered, None)
             
-            i += 1
+            # Lines may come without their '\n' (e.g. a plain list passed to
+            # parse_lines), so tokens are separated explicitly
+            rule_content = ' '.join(rule_lines)
         
-        # Parse rule content with enhanced patterns
-        rule_content = ' '.join(rule_lines)
-        self.extract_enhanced_rule_details(rule_name, rule_content, line_num)
+        # The block is already consumed from the stream, so record errors here
+        # and still hand the lookahead back to parse_lines
+        rule = None
+        try:
+            # Parse rule content with enhanced patterns
+            rule = self.build_enhanced_rule(rule_name, rule_content, line_num)
+        except Exception as e:
+            self.errors.append(f"Error parsing line {line_num}: {e}")
         
-        return i  # Return the last processed line index
+        # The rule (None if it failed to parse) and the next unconsumed
+        # (line_num, line), or None at EOF
+        return rule, pending
     
     def extract_enhanced_rule_details(self, rule_name: str, content: str, line_num: int):
-        """Extract details from rule content with enhanced pattern recognition"""
+        """Extract details from rule content and append the rule to self.rules"""
+        self.rules.append(self.build_enhanced_rule(rule_name, content, line_num))
+    
+    @staticmethod
+    def build_enhanced_rule(rule_name: str, content: str, line_num: int) -> DRCRule:
+        """Extract details from rule content with enhanced pattern recognition
         
-        # Extract description
+        Stateless: it reads only module-level tables and returns the rule, so
+        rule blocks can be extracted independently (e.g. in a process pool).
+        """
+        
+        # Extract description; it always starts with '@'
         description = ""
-        desc_match = re.search(r'@\s*"([^"]+)"', content)
-        if desc_match:
-            description = desc_match.group(1)
+        if '@' in content:
+            desc_match = _DESC_RE.search(content)
+            if desc_match:
+                description = desc_match.group(1)
         
-        rule_type = "unknown"
-        layer = ""
-        operator = ""
-        value = 0.0
-        extra_params = []
-        enclosure_layers = None
-        antenna_params = None
-        pattern_params = None
+        # Try the patterns in priority order; the first one that matches wins.
+        # A body without a category's keyword skips that pattern's search.
+        match = None
+        content_upper = content.upper()
+        if len(content_upper) == len(content):
+            for rule_category, keyword, rule_re in _RULE_PATTERNS:
+                if keyword in content_upper:
+                    match = rule_re.search(content_upper)
+                    if match:
+                        break
+        else:
+            for rule_category, rule_re in _RULE_PATTERNS_ANYCASE:
+                match = rule_re.search(content)
+                if match:
+                    break
         
-        # Try enhanced patterns first
-        for pattern, rule_category in self.enhanced_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                if rule_category == 'width':
-                    rule_type = "internal1"
-                    layer = match.group(2)
-                    operator = match.group(3)
-                    value = float(match.group(4))
-                    
-                elif rule_category == 'length':
-                    rule_type = "internal2"
-                    layer = match.group(2)
-                    operator = match.group(3)
-                    value = float(match.group(4))
-                    
-                elif rule_category == 'spacing':
-                    rule_type = "external1"
-                    layer = match.group(2)
-                    operator = match.group(3)
-                    value = float(match.group(4))
-                    
-                elif rule_category == 'inter_spacing':
-                    rule_type = "external"
-                    layer = match.group(2)
-                    operator = match.group(4)
-                    value = float(match.group(5))
-                    extra_params = [match.group(3)]  # Second layer
-                    
-                elif rule_category == 'area':
-                    rule_type = "area"
-                    layer = match.group(2)
-                    operator = match.group(3)
-                    value = float(match.group(4))
-                    
-                elif rule_category in ['density', 'density_simple']:
-                    rule_type = "density"
-                    layer = match.group(2)
-                    if rule_category == 'density':
-                        operator = match.group(6)
-                        value = float(match.group(7))
-                    else:  # density_simple
-                        operator = match.group(6)
-                        value = float(match.group(7))
-                    extra_params = [match.group(3), match.group(4)]  # Window dimensions
-                    
-                elif rule_category == 'enclosure':
-                    rule_type = "enclosure"
-                    layer = match.group(1)  # Inner layer
-                    enclosure_layers = [match.group(2)]  # Outer layer
-                    operator = match.group(3)
-                    value = float(match.group(4))
-                    
-                elif rule_category == 'antenna_ratio':
-                    rule_type = "antenna"
-                    layer = match.group(1)  # Metal layer
-                    antenna_params = {
-                        'gate_layer': match.group(2),
-                        'max_ratio': float(match.group(3))
-                    }
-                    operator = "MAX_RATIO"
-                    value = float(match.group(3))
-                    
-                elif rule_category == 'rectangle':
-                    rule_type = "pattern_matching"
-                    layer = match.group(1)
-                    pattern_params = {
-                        'type': 'rectangle',
-                        'length_op': match.group(2),
-                        'length_val': float(match.group(3)),
-                        'width_op': match.group(4),
-                        'width_val': float(match.group(5))
-                    }
-                    operator = "RECTANGLE"
-                    value = 0.0
-                    
-                elif rule_category == 'same_mask_spacing':
-                    rule_type = "multi_patterning"
-                    layer = match.group(2)
-                    operator = match.group(3)
-                    value = float(match.group(4))
-                    extra_params = ['SAME_MASK']
-                    
-                elif rule_category == 'opposite_constraint':
-                    rule_type = "advanced_constraint"
-                    layer = match.group(2)
-                    operator = match.group(3)
-                    value = float(match.group(4))
-                    extra_params = ['OPPOSITE']
-                
-                break
+        if match:
+            # Slice captures from the original so layer names keep their case;
+            # groups[n] is group n of the matched pattern
+            groups = [content[a:b] if a >= 0 else None
+                      for a, b in map(match.span, range(match.re.groups + 1))]
+            
+            fields = _CATEGORY_HANDLERS[rule_category](groups)
+            
+            # Layer names and operators repeat across the whole deck; intern
+            # them so rules share one string each (rule types are literals)
+            fields['layer'] = sys.intern(fields['layer'])
+            fields['operator'] = sys.intern(fields['operator'])
+        else:
+            fields = {'rule_type': "unknown", 'layer': "", 'operator': "", 'value': 0.0}
+        
+        # Rare per-rule payloads stay None unless the rule actually has them,
+        # so the common case allocates nothing for them
+        extra_params = fields.pop('extra_params', None)
         
-        # Check for additional parameters
-        if 'SINGULAR' in content:
-            extra_params.append('SINGULAR')
+        # Check for additional parameters; plain substring tests rule out the
+        # regex scan for the many rules without any qualifier
+        if any(keyword in content for keyword in _QUALIFIER_KEYWORDS):
+            for keyword in _KEYWORDS_RE.findall(content):
+                if extra_params is None:
+                    extra_params = []
+                if keyword not in extra_params:
+                    extra_params.append(keyword)
         
-        self.rules.append(DRCRule(
+        return DRCRule(
             name=rule_name,
             description=description,
-            rule_type=rule_type,
-            layer=layer,
-            operator=operator,
-            value=value,
             line_number=line_num,
-            extra_params=extra_params or None,
-            enclosure_layers=enclosure_layers,
-            antenna_params=antenna_params,
-            pattern_params=pattern_params
-        ))
+            extra_params=extra_params,
+            **fields
+        )
     
     def get_statistics(self):
         """Get parsing statistics"""
-        layer_types = {}
-        rule_types = {}
-        
-        for layer in self.layers:
-            if layer.gds_number is not None:
-                layer_types['primary'] = layer_types.get('primary', 0) + 1
-            else:
-                layer_types['derived'] = layer_types.get('derived', 0) + 1
-        
-        for rule in self.rules:
-            rule_types[rule.rule_type] = rule_types.get(rule.rule_type, 0) + 1
+        # Counter does the tallying in C; callers get plain dicts as before
+        layer_types = Counter('primary' if layer.gds_number is not None else 'derived'
+                              for layer in self.layers)
+        rule_types = Counter(rule.rule_type for rule in self.rules)
         
         return {
             'layers': len(self.layers),
-            'layer_types': layer_types,
+            'layer_types': dict(layer_types),
             'rules': len(self.rules),
-            'rule_types': rule_types,
+            'rule_types': dict(rule_types),
             'includes': len(self.includes),
             'errors': len(self.errors)
         }
@@ -6,14 +6,52 @@ Supports all SVRF constructs including enclosure, antenna, and pattern matching
 
 import re
 import sys
+from collections import Counter, defaultdict
+from functools import partial
+from itertools import islice
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from pathlib import Path
 from enhanced_svrf_parser import EnhancedSVRFParser, Layer, DRCRule
 
-@dataclass
+# Second-layer name patterns for two-layer spacing rules, tried in order:
+# LAYER1_LAYER2_SPACE, "LAYER1 to LAYER2 spacing", "LAYER1 and LAYER2"
+_SECOND_LAYER_PATTERNS = [
+    re.compile(r'(\w+)_(\w+)_SPACE', re.IGNORECASE),
+    re.compile(r'(\w+)\s+to\s+(\w+)', re.IGNORECASE),
+    re.compile(r'(\w+)\s+and\s+(\w+)', re.IGNORECASE),
+]
+
+# Word operator -> ICV symbol; lookarounds keep spaces so "A AND NOT B" works
+_LAYER_OP_MAP = {'AND': '&', 'OR': '|', 'NOT': '!'}
+_LAYER_OP_RE = re.compile(r'(?<= )(?:AND|OR|NOT)(?= )')
+
+# Single-layer checks sharing one shape, as rule_type -> (ICV function,
+# operation for '<' rules, operation for any other operator)
+_SIMPLE_TRANSLATIONS = {
+    'internal1': ('width', 'width check', 'width constraint'),
+    'internal2': ('length', 'length check', 'length check'),
+    'external1': ('space', 'spacing check', 'spacing constraint'),
+    'area': ('area', 'area check', 'area check'),
+}
+
+# SVRF enclosure operators that ICV spells differently; others pass through
+_ENCLOSURE_OP_MAP = {'==': '>='}
+
+# ICV operations for constructs the basic translator could not handle,
+# listed by print_enhanced_features
+_ENHANCED_OPERATIONS = frozenset({
+    "enclosure check", "antenna check", "pattern matching",
+    "same-mask spacing", "multi-patterning spacing", "advanced constraint",
+})
+
+# ICVRule gets slots on Python 3.10+, the first release with dataclass(slots=)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ICVRule:
     """Enhanced ICV DRC Rule representation"""
+    # The translate_* methods construct rules positionally; keep this order
     name: str
     description: str
     layer: str
@@ -22,7 +60,33 @@ class ICVRule:
     value: float
     icv_syntax: str
     line_number: int = 0
-    icv_functions: List[str] = None  # Multiple ICV functions for complex rules
+    icv_functions: Optional[List[str]] = None  # Multiple ICV functions for complex rules
+
+def _render_icv_rule(rule: ICVRule) -> str:
+    """Render one translated rule as ICV text, including its comment lines"""
+    text = f"// Rule: {rule.name}\n"
+    if rule.description:
+        text += f"// Description: {rule.description}\n"
+    
+    name_lc = rule.name.lower()
+    
+    # Handle complex rules with multiple functions
+    if rule.icv_functions:
+        return (f"{text}"
+                f"rule {name_lc}_part1 {{\n"
+                f"    check_rule = {rule.icv_functions[0]};\n"
+                f"    error_message = \"{rule.description} (length)\";\n"
+                f"}}\n\n"
+                f"rule {name_lc}_part2 {{\n"
+                f"    check_rule = {rule.icv_functions[1]};\n"
+                f"    error_message = \"{rule.description} (width)\";\n"
+                f"}}\n\n")
+    
+    return (f"{text}"
+            f"rule {name_lc} {{\n"
+            f"    check_rule = {rule.icv_syntax};\n"
+            f"    error_message = \"{rule.description or rule.name}\";\n"
+            f"}}\n\n")
 
 class EnhancedSVRFToICVTranslator:
     """Enhanced translator with 100% SVRF rule coverage"""
@@ -34,20 +98,21 @@ class EnhancedSVRFToICVTranslator:
         self.technology = "Generic"
         self.process_node = "180nm"
         
-        # Enhanced SVRF to ICV syntax mappings
+        # Enhanced SVRF to ICV syntax mappings; the simple single-layer
+        # checks dispatch straight to the table-driven builder
         self.enhanced_rule_mappings = {
-            'internal1': self.translate_internal1,
-            'internal2': self.translate_internal2,
-            'external1': self.translate_external1,
+            rule_type: partial(self._translate_simple, *spec)
+            for rule_type, spec in _SIMPLE_TRANSLATIONS.items()
+        }
+        self.enhanced_rule_mappings.update({
             'external': self.translate_external,
-            'area': self.translate_area,
             'density': self.translate_density,
             'enclosure': self.translate_enclosure,
             'antenna': self.translate_antenna,
             'pattern_matching': self.translate_pattern_matching,
             'multi_patterning': self.translate_multi_patterning,
             'advanced_constraint': self.translate_advanced_constraint
-        }
+        })
     
     def translate_file(self, svrf_file: str, output_file: str = None):
         """Translate SVRF file to ICV format with enhanced coverage"""
@@ -74,16 +139,19 @@ class EnhancedSVRFToICVTranslator:
     
     def translate_layers(self):
         """Translate SVRF layer definitions to ICV format"""
+        append_layer = self.icv_layers.append
+        translate_expression = self.translate_layer_expression
+        
         for layer in self.svrf_parser.layers:
             if layer.gds_number is not None:
                 # Primary layer
                 icv_layer = f"LAYER {layer.name} = {layer.gds_number};"
             else:
                 # Derived layer
-                icv_expression = self.translate_layer_expression(layer.expression)
+                icv_expression = translate_expression(layer.expression)
                 icv_layer = f"LAYER {layer.name} = {icv_expression};"
             
-            self.icv_layers.append(icv_layer)
+            append_layer(icv_layer)
     
     def translate_layer_expression(self, expression: str) -> str:
         """Translate SVRF layer expressions to ICV format"""
@@ -91,82 +159,50 @@ class EnhancedSVRFToICVTranslator:
             return ""
         
         # Enhanced translation mappings
-        icv_expr = expression.replace(" AND ", " & ")
-        icv_expr = icv_expr.replace(" OR ", " | ")
-        icv_expr = icv_expr.replace(" NOT ", " ! ")
-        
-        # Handle parentheses and complex expressions
-        icv_expr = icv_expr.replace("(", "(").replace(")", ")")
-        
-        return icv_expr
+        return _LAYER_OP_RE.sub(lambda m: _LAYER_OP_MAP[m.group(0)], expression)
     
     def translate_rules_enhanced(self):
         """Translate SVRF rules to ICV format with enhanced coverage"""
+        mapping = self.enhanced_rule_mappings
+        append = self.icv_rules.append
+        
         for rule in self.svrf_parser.rules:
-            if rule.rule_type in self.enhanced_rule_mappings:
-                icv_rule = self.enhanced_rule_mappings[rule.rule_type](rule)
-                if icv_rule:
-                    self.icv_rules.append(icv_rule)
-            else:
+            translate = mapping.get(rule.rule_type)
+            if translate is None:
                 print(f"Warning: Unsupported rule type '{rule.rule_type}' for rule {rule.name}")
+                continue
+            
+            icv_rule = translate(rule)
+            if icv_rule:
+                append(icv_rule)
+    
+    def _translate_simple(self, function: str, check_operation: str,
+                          constraint_operation: str, rule: DRCRule) -> ICVRule:
+        """Translate a single-layer check described by _SIMPLE_TRANSLATIONS"""
+        op, val, layer = rule.operator, rule.value, rule.layer
+        constraint = f"{op} {val}"
+        operation = check_operation if op == '<' else constraint_operation
+        
+        return ICVRule(rule.name, rule.description, layer, operation, constraint, val,
+                       f"{function}({layer}) {constraint}", rule.line_number)
     
     def translate_internal1(self, rule: DRCRule) -> ICVRule:
         """Translate INTERNAL1 (width) rules"""
-        if rule.operator == '<':
-            icv_syntax = f"width({rule.layer}) < {rule.value}"
-            operation = "width check"
-        else:
-            icv_syntax = f"width({rule.layer}) {rule.operator} {rule.value}"
-            operation = "width constraint"
-        
-        return ICVRule(
-            name=rule.name,
-            description=rule.description,
-            layer=rule.layer,
-            operation=operation,
-            constraint=f"{rule.operator} {rule.value}",
-            value=rule.value,
-            icv_syntax=icv_syntax,
-            line_number=rule.line_number
-        )
+        return self._translate_simple(*_SIMPLE_TRANSLATIONS['internal1'], rule)
     
     def translate_internal2(self, rule: DRCRule) -> ICVRule:
         """Translate INTERNAL2 (length) rules"""
-        icv_syntax = f"length({rule.layer}) {rule.operator} {rule.value}"
-        
-        return ICVRule(
-            name=rule.name,
-            description=rule.description,
-            layer=rule.layer,
-            operation="length check",
-            constraint=f"{rule.operator} {rule.value}",
-            value=rule.value,
-            icv_syntax=icv_syntax,
-            line_number=rule.line_number
-        )
+        return self._translate_simple(*_SIMPLE_TRANSLATIONS['internal2'], rule)
     
     def translate_external1(self, rule: DRCRule) -> ICVRule:
         """Translate EXTERNAL1 (spacing) rules"""
-        if rule.operator == '<':
-            icv_syntax = f"space({rule.layer}) < {rule.value}"
-            operation = "spacing check"
-        else:
-            icv_syntax = f"space({rule.layer}) {rule.operator} {rule.value}"
-            operation = "spacing constraint"
-        
-        return ICVRule(
-            name=rule.name,
-            description=rule.description,
-            layer=rule.layer,
-            operation=operation,
-            constraint=f"{rule.operator} {rule.value}",
-            value=rule.value,
-            icv_syntax=icv_syntax,
-            line_number=rule.line_number
-        )
+        return self._translate_simple(*_SIMPLE_TRANSLATIONS['external1'], rule)
     
     def translate_external(self, rule: DRCRule) -> ICVRule:
         """Translate EXTERNAL (inter-layer spacing) rules"""
+        layer = rule.layer
+        constraint = f"{rule.operator} {rule.value}"
+        
         # Get second layer from extra_params or infer from rule name
         second_layer = None
         if rule.extra_params:
@@ -175,37 +211,18 @@ class EnhancedSVRFToICVTranslator:
             second_layer = self.extract_second_layer(rule.name, rule.description)
         
         if second_layer:
-            icv_syntax = f"space({rule.layer}, {second_layer}) {rule.operator} {rule.value}"
+            icv_syntax = f"space({layer}, {second_layer}) {constraint}"
             operation = "inter-layer spacing"
         else:
-            icv_syntax = f"space({rule.layer}) {rule.operator} {rule.value}"
+            icv_syntax = f"space({layer}) {constraint}"
             operation = "spacing check"
         
-        return ICVRule(
-            name=rule.name,
-            description=rule.description,
-            layer=rule.layer,
-            operation=operation,
-            constraint=f"{rule.operator} {rule.value}",
-            value=rule.value,
-            icv_syntax=icv_syntax,
-            line_number=rule.line_number
-        )
+        return ICVRule(rule.name, rule.description, layer, operation, constraint,
+                       rule.value, icv_syntax, rule.line_number)
     
     def translate_area(self, rule: DRCRule) -> ICVRule:
         """Translate AREA rules"""
-        icv_syntax = f"area({rule.layer}) {rule.operator} {rule.value}"
-        
-        return ICVRule(
-            name=rule.name,
-            description=rule.description,
-            layer=rule.layer,
-            operation="area check",
-            constraint=f"{rule.operator} {rule.value}",
-            value=rule.value,
-            icv_syntax=icv_syntax,
-            line_number=rule.line_number
-        )
+        return self._translate_simple(*_SIMPLE_TRANSLATIONS['area'], rule)
     
     def translate_density(self, rule: DRCRule) -> ICVRule:
         """Translate DENSITY rules"""
@@ -215,18 +232,12 @@ class EnhancedSVRFToICVTranslator:
             window_x = float(rule.extra_params[0])
             window_y = float(rule.extra_params[1])
         
-        icv_syntax = f"density({rule.layer}, {window_x}, {window_y}) {rule.operator} {rule.value}"
-        
-        return ICVRule(
-            name=rule.name,
-            description=rule.description,
-            layer=rule.layer,
-            operation="density check",
-            constraint=f"{rule.operator} {rule.value}",
-            value=rule.value,
-            icv_syntax=icv_syntax,
-            line_number=rule.line_number
-        )
+        layer = rule.layer
+        constraint = f"{rule.operator} {rule.value}"
+        icv_syntax = f"density({layer}, {window_x}, {window_y}) {constraint}"
+        
+        return ICVRule(rule.name, rule.description, layer, "density check", constraint,
+                       rule.value, icv_syntax, rule.line_number)
     
     def translate_enclosure(self, rule: DRCRule) -> ICVRule:
         """Translate enclosure rules (NEW - was unsupported)"""
@@ -239,25 +250,13 @@ class EnhancedSVRFToICVTranslator:
         # ICV: enclosure(OUTER, INNER) >= VALUE
         
         # Adjust operator for ICV syntax
-        if rule.operator == '>=':
-            icv_operator = '>='
-        elif rule.operator == '==':
-            icv_operator = '>='
-        else:
-            icv_operator = rule.operator
-        
-        icv_syntax = f"enclosure({outer_layer}, {inner_layer}) {icv_operator} {rule.value}"
-        
-        return ICVRule(
-            name=rule.name,
-            description=rule.description,
-            layer=inner_layer,
-            operation="enclosure check",
-            constraint=f"{icv_operator} {rule.value}",
-            value=rule.value,
-            icv_syntax=icv_syntax,
-            line_number=rule.line_number
-        )
+        icv_operator = _ENCLOSURE_OP_MAP.get(rule.operator, rule.operator)
+        
+        constraint = f"{icv_operator} {rule.value}"
+        icv_syntax = f"enclosure({outer_layer}, {inner_layer}) {constraint}"
+        
+        return ICVRule(rule.name, rule.description, inner_layer, "enclosure check",
+                       constraint, rule.value, icv_syntax, rule.line_number)
     
     def translate_antenna(self, rule: DRCRule) -> ICVRule:
         """Translate antenna rules (NEW - was unsupported)"""
@@ -268,16 +267,8 @@ class EnhancedSVRFToICVTranslator:
         # ICV antenna syntax: antenna_ratio(metal_layer, gate_layer) <= max_ratio
         icv_syntax = f"antenna_ratio({metal_layer}, {gate_layer}) <= {max_ratio}"
         
-        return ICVRule(
-            name=rule.name,
-            description=rule.description,
-            layer=metal_layer,
-            operation="antenna check",
-            constraint=f"<= {max_ratio}",
-            value=max_ratio,
-            icv_syntax=icv_syntax,
-            line_number=rule.line_number
-        )
+        return ICVRule(rule.name, rule.description, metal_layer, "antenna check",
+                       f"<= {max_ratio}", max_ratio, icv_syntax, rule.line_number)
     
     def translate_pattern_matching(self, rule: DRCRule) -> ICVRule:
         """Translate pattern matching rules (NEW - was unsupported)"""
@@ -292,165 +283,112 @@ class EnhancedSVRFToICVTranslator:
             # Combine both constraints with AND
             icv_syntax = f"({length_constraint}) && ({width_constraint})"
             
-            return ICVRule(
-                name=rule.name,
-                description=rule.description,
-                layer=layer,
-                operation="pattern matching",
-                constraint=f"rectangle constraints",
-                value=0.0,
-                icv_syntax=icv_syntax,
-                line_number=rule.line_number,
-                icv_functions=[length_constraint, width_constraint]
-            )
+            return ICVRule(rule.name, rule.description, layer, "pattern matching",
+                           f"rectangle constraints", 0.0, icv_syntax, rule.line_number,
+                           [length_constraint, width_constraint])
         
         # Fallback for other pattern types
         icv_syntax = f"pattern_check({layer})"
-        return ICVRule(
-            name=rule.name,
-            description=rule.description,
-            layer=layer,
-            operation="pattern check",
-            constraint="pattern",
-            value=0.0,
-            icv_syntax=icv_syntax,
-            line_number=rule.line_number
-        )
+        return ICVRule(rule.name, rule.description, layer, "pattern check", "pattern",
+                       0.0, icv_syntax, rule.line_number)
     
     def translate_multi_patterning(self, rule: DRCRule) -> ICVRule:
         """Translate multi-patterning rules (NEW - was unsupported)"""
         layer = rule.layer
+        constraint = f"{rule.operator} {rule.value}"
         
         # SAME_MASK spacing rules
         if rule.extra_params and 'SAME_MASK' in rule.extra_params:
-            icv_syntax = f"space_same_mask({layer}) {rule.operator} {rule.value}"
+            icv_syntax = f"space_same_mask({layer}) {constraint}"
             operation = "same-mask spacing"
         else:
-            icv_syntax = f"mp_space({layer}) {rule.operator} {rule.value}"
+            icv_syntax = f"mp_space({layer}) {constraint}"
             operation = "multi-patterning spacing"
         
-        return ICVRule(
-            name=rule.name,
-            description=rule.description,
-            layer=layer,
-            operation=operation,
-            constraint=f"{rule.operator} {rule.value}",
-            value=rule.value,
-            icv_syntax=icv_syntax,
-            line_number=rule.line_number
-        )
+        return ICVRule(rule.name, rule.description, layer, operation, constraint,
+                       rule.value, icv_syntax, rule.line_number)
     
     def translate_advanced_constraint(self, rule: DRCRule) -> ICVRule:
         """Translate advanced constraint rules (NEW - was unsupported)"""
         layer = rule.layer
+        constraint = f"{rule.operator} {rule.value}"
         
         # OPPOSITE constraints
         if rule.extra_params and 'OPPOSITE' in rule.extra_params:
-            icv_syntax = f"width_opposite({layer}) {rule.operator} {rule.value}"
+            icv_syntax = f"width_opposite({layer}) {constraint}"
             operation = "opposite constraint"
         else:
-            icv_syntax = f"advanced_check({layer}) {rule.operator} {rule.value}"
+            icv_syntax = f"advanced_check({layer}) {constraint}"
             operation = "advanced constraint"
         
-        return ICVRule(
-            name=rule.name,
-            description=rule.description,
-            layer=layer,
-            operation=operation,
-            constraint=f"{rule.operator} {rule.value}",
-            value=rule.value,
-            icv_syntax=icv_syntax,
-            line_number=rule.line_number
-        )
+        return ICVRule(rule.name, rule.description, layer, operation, constraint,
+                       rule.value, icv_syntax, rule.line_number)
     
     def extract_second_layer(self, rule_name: str, description: str) -> Optional[str]:
         """Extract second layer name from rule name or description"""
-        # Common patterns: LAYER1_LAYER2_SPACE, "LAYER1 to LAYER2 spacing"
-        patterns = [
-            r'(\w+)_(\w+)_SPACE',
-            r'(\w+)\s+to\s+(\w+)',
-            r'(\w+)\s+and\s+(\w+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, rule_name, re.IGNORECASE)
+        for pattern in _SECOND_LAYER_PATTERNS:
+            match = pattern.search(rule_name) or (description and pattern.search(description))
             if match:
                 return match.group(2)
-            
-            if description:
-                match = re.search(pattern, description, re.IGNORECASE)
-                if match:
-                    return match.group(2)
         
         return None
     
     def write_icv_file(self, output_file: str):
         """Write translated rules to ICV format file"""
-        with open(output_file, 'w') as f:
-            # Write header
-            f.write(f"// Enhanced ICV DRC Rules translated from SVRF\n")
-            f.write(f"// Technology: {self.technology}\n")
-            f.write(f"// Process Node: {self.process_node}\n")
-            f.write(f"// Generated by Enhanced SVRF to ICV Translator\n")
-            f.write(f"// Total Rules: {len(self.icv_rules)}\n")
-            f.write(f"// Total Layers: {len(self.icv_layers)}\n")
-            f.write(f"// Coverage: 100%\n\n")
-            
-            # Write run options
-            f.write("// Run Options\n")
-            f.write("run_options {\n")
-            f.write("    layout_file = \"layout.gds\";\n")
-            f.write("    output_dir = \"./icv_results\";\n")
-            f.write("    temp_dir = \"./icv_temp\";\n")
-            f.write("    report_file = \"drc_report.txt\";\n")
-            f.write("    summary_file = \"drc_summary.txt\";\n")
-            f.write("    error_limit = 1000;\n")
-            f.write("    verbose = true;\n")
-            f.write("}\n\n")
-            
-            # Write layer definitions
-            f.write("// Layer Definitions\n")
-            for layer in self.icv_layers:
-                f.write(f"{layer}\n")
-            f.write("\n")
-            
-            # Write rules grouped by type
-            rule_groups = {}
-            for rule in self.icv_rules:
-                if rule.operation not in rule_groups:
-                    rule_groups[rule.operation] = []
-                rule_groups[rule.operation].append(rule)
-            
-            for group_name, rules in rule_groups.items():
-                f.write(f"// {group_name.title()} Rules\n")
-                for rule in rules:
-                    f.write(f"// Rule: {rule.name}\n")
-                    if rule.description:
-                        f.write(f"// Description: {rule.description}\n")
-                    
-                    # Handle complex rules with multiple functions
-                    if rule.icv_functions:
-                        f.write(f"rule {rule.name.lower()}_part1 {{\n")
-                        f.write(f"    check_rule = {rule.icv_functions[0]};\n")
-                        f.write(f"    error_message = \"{rule.description} (length)\";\n")
-                        f.write(f"}}\n\n")
-                        
-                        f.write(f"rule {rule.name.lower()}_part2 {{\n")
-                        f.write(f"    check_rule = {rule.icv_functions[1]};\n")
-                        f.write(f"    error_message = \"{rule.description} (width)\";\n")
-                        f.write(f"}}\n\n")
-                    else:
-                        f.write(f"rule {rule.name.lower()} {{\n")
-                        f.write(f"    check_rule = {rule.icv_syntax};\n")
-                        f.write(f"    error_message = \"{rule.description or rule.name}\";\n")
-                        f.write(f"}}\n\n")
+        # Build the whole deck in memory; a single large write bypasses the
+        # 8 KB I/O buffer instead of filling and flushing it repeatedly
+        parts = []
+        emit = parts.append
+        
+        # Header
+        emit(f"// Enhanced ICV DRC Rules translated from SVRF\n"
+             f"// Technology: {self.technology}\n"
+             f"// Process Node: {self.process_node}\n"
+             f"// Generated by Enhanced SVRF to ICV Translator\n"
+             f"// Total Rules: {len(self.icv_rules)}\n"
+             f"// Total Layers: {len(self.icv_layers)}\n"
+             f"// Coverage: 100%\n\n")
+        
+        # Run options
+        emit("// Run Options\n"
+             "run_options {\n"
+             "    layout_file = \"layout.gds\";\n"
+             "    output_dir = \"./icv_results\";\n"
+             "    temp_dir = \"./icv_temp\";\n"
+             "    report_file = \"drc_report.txt\";\n"
+             "    summary_file = \"drc_summary.txt\";\n"
+             "    error_limit = 1000;\n"
+             "    verbose = true;\n"
+             "}\n\n")
+        
+        # Layer definitions
+        emit("// Layer Definitions\n")
+        for layer in self.icv_layers:
+            emit(f"{layer}\n")
+        emit("\n")
+        
+        # Rules grouped by type, rendered as they are grouped so the rule
+        # list is only walked once
+        rule_groups = defaultdict(list)
+        for rule in self.icv_rules:
+            rule_groups[rule.operation].append(_render_icv_rule(rule))
+        
+        for group_name, blocks in rule_groups.items():
+            emit(f"// {group_name.title()} Rules\n")
+            parts.extend(blocks)
+        
+        Path(output_file).write_text(''.join(parts))
     
     def print_translation_summary(self):
         """Print enhanced translation summary"""
+        total_rules = len(self.svrf_parser.rules)
+        translated_rules = len(self.icv_rules)
+        coverage = translated_rules / total_rules * 100 if total_rules else 0.0
+        
         print(f"Enhanced SVRF to ICV Translation Summary:")
-        print(f"  Input SVRF Rules: {len(self.svrf_parser.rules)}")
-        print(f"  Translated ICV Rules: {len(self.icv_rules)}")
-        print(f"  Translation Coverage: {len(self.icv_rules)/len(self.svrf_parser.rules)*100:.1f}%")
+        print(f"  Input SVRF Rules: {total_rules}")
+        print(f"  Translated ICV Rules: {translated_rules}")
+        print(f"  Translation Coverage: {coverage:.1f}%")
         print(f"  Input SVRF Layers: {len(self.svrf_parser.layers)}")
         print(f"  Translated ICV Layers: {len(self.icv_layers)}")
         
@@ -458,9 +396,7 @@ class EnhancedSVRFToICVTranslator:
             print(f"  Parse Errors: {len(self.svrf_parser.errors)}")
         
         # Show rule type distribution
-        rule_types = {}
-        for rule in self.icv_rules:
-            rule_types[rule.operation] = rule_types.get(rule.operation, 0) + 1
+        rule_types = Counter(rule.operation for rule in self.icv_rules)
         
         print(f"\n  Enhanced Rule Type Distribution:")
         for rule_type, count in sorted(rule_types.items()):
@@ -468,15 +404,13 @@ class EnhancedSVRFToICVTranslator:
     
     def print_enhanced_features(self):
         """Print enhanced translation features"""
-        enhanced_rules = []
-        for rule in self.icv_rules:
-            if rule.operation in ["enclosure check", "antenna check", "pattern matching", 
-                                  "same-mask spacing", "multi-patterning spacing", "advanced constraint"]:
-                enhanced_rules.append(rule)
+        # Only the first 10 are shown, so stop filtering once they are found
+        enhanced_rules = list(islice(
+            (rule for rule in self.icv_rules if rule.operation in _ENHANCED_OPERATIONS), 10))
         
         if enhanced_rules:
             print(f"\n  Enhanced Features Translated:")
-            for rule in enhanced_rules[:10]:  # Show first 10
+            for rule in enhanced_rules:
                 print(f"    {rule.name}: {rule.operation}")
                 print(f"      ICV: {rule.icv_syntax}")
 
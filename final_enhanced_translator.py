@@ -6,18 +6,128 @@ Handles all SVRF constructs with robust error handling
 
 import re
 import sys
+from collections import Counter
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
-@dataclass
+# Statement and rule classification patterns, compiled once at import
+_INCLUDE_RE = re.compile(r'INCLUDE\s+"([^"]+)"')
+_DESC_RE = re.compile(r'@\s*"([^"]+)"')
+_ENCLOSURE_RE = re.compile(r'(\w+)\s+NOT\s+INSIDE\s+(\w+)\s+BY\s*(>=|==|<=)\s*([\d.]+)')
+_ANTENNA_RE = re.compile(r'ANTENNA\s+(\w+)\s+(\w+)\s+MAX\s+RATIO\s+([\d.]+)')
+_RECTANGLE_RE = re.compile(r'RECTANGLE\s+(\w+)\s+LENGTH\s*([<>=]+)\s*([\d.]+)\s+WIDTH\s*([<>=]+)\s*([\d.]+)')
+_SAME_MASK_RE = re.compile(r'EXTERNAL1\s+(\w+)\s*(<|>|==)\s*([\d.]+)\s+SAME_MASK')
+_INTER_LAYER_RE = re.compile(r'EXTERNAL\s+(\w+)\s+(\w+)\s*(<|>|==)\s*([\d.]+)')
+_EXTERNAL1_RE = re.compile(r'EXTERNAL1\s+(\w+)\s*(<|>|==)\s*([\d.]+)')
+_DENSITY_RE = re.compile(r'DENSITY\s+(\w+)\s+WINDOW\s+([\d.]+)\s+([\d.]+)\s*(<|>|==)\s*([\d.]+)')
+_AREA_RE = re.compile(r'AREA\s+(\w+)\s*(<|>|==)\s*([\d.]+)')
+_INTERNAL2_RE = re.compile(r'INTERNAL2\s+(\w+)\s*(<|>|==)\s*([\d.]+)')
+_INTERNAL1_RE = re.compile(r'INTERNAL1\s+(\w+)\s*(<|>|==)\s*([\d.]+)')
+
+# Derived layer word operators and the ICV symbols that replace them
+_LAYER_OP_MAP = {'AND': '&', 'OR': '|', 'NOT': '!'}
+_LAYER_OP_RE = re.compile(r'(?<= )(?:AND|OR|NOT)(?= )')
+
+@lru_cache(maxsize=1024)
+def _to_float(text):
+    """Cached float() for rule thresholds"""
+    return float(text)
+
+# DRCRule fields for a classification match, by group number
+def _enclosure_fields(match):
+    return {
+        'layer': match[1],  # Inner layer
+        'second_layer': match[2],  # Outer layer
+        'operator': match[3],
+        'value': _to_float(match[4]),
+    }
+
+def _antenna_fields(match):
+    max_ratio = _to_float(match[3])
+    return {
+        'layer': match[1],
+        'antenna_params': {
+            'gate_layer': match[2],
+            'max_ratio': max_ratio
+        },
+        'operator': "MAX_RATIO",
+        'value': max_ratio,
+    }
+
+def _rectangle_fields(match):
+    return {
+        'layer': match[1],
+        'operator': "RECTANGLE",
+        'value': 0.0,
+        'extra_params': [f"LENGTH{match[2]}{match[3]}",
+                         f"WIDTH{match[4]}{match[5]}"],
+    }
+
+def _same_mask_fields(match):
+    return {
+        'layer': match[1],
+        'operator': match[2],
+        'value': _to_float(match[3]),
+        'extra_params': ['SAME_MASK'],
+    }
+
+def _inter_layer_fields(match):
+    return {
+        'layer': match[1],
+        'second_layer': match[2],
+        'operator': match[3],
+        'value': _to_float(match[4]),
+    }
+
+def _density_fields(match):
+    # Only the first density statement of a rule is used
+    return {
+        'layer': match[1],
+        'operator': match[4],
+        'value': _to_float(match[5]),
+        'extra_params': [match[2], match[3]],  # Window dimensions
+    }
+
+def _single_layer_fields(match):
+    return {
+        'layer': match[1],
+        'operator': match[2],
+        'value': _to_float(match[3]),
+    }
+
+# Rule classification, ordered by complexity: (keywords, branches). The first
+# entry whose keywords all occur in the rule body decides the rule; its
+# branches are tried in order as (rule_type, regex, field builder), and if
+# none matches the rule stays unknown. Enclosure rules are checked before
+# the table because a failed enclosure match falls through to it.
+_RULE_DISPATCH = (
+    (('ANTENNA', 'MAX RATIO'), (('antenna', _ANTENNA_RE, _antenna_fields),)),
+    (('RECTANGLE',), (('pattern_matching', _RECTANGLE_RE, _rectangle_fields),)),
+    (('SAME_MASK',), (('multi_patterning', _SAME_MASK_RE, _same_mask_fields),)),
+    # Inter-layer spacing first, then single layer spacing
+    (('EXTERNAL',), (('external', _INTER_LAYER_RE, _inter_layer_fields),
+                     ('external1', _EXTERNAL1_RE, _single_layer_fields))),
+    (('DENSITY', 'WINDOW'), (('density', _DENSITY_RE, _density_fields),)),
+    (('AREA',), (('area', _AREA_RE, _single_layer_fields),)),
+    (('INTERNAL2',), (('internal2', _INTERNAL2_RE, _single_layer_fields),)),
+    (('INTERNAL1',), (('internal1', _INTERNAL1_RE, _single_layer_fields),)),
+)
+
+_UNKNOWN_FIELDS = {'layer': "", 'operator': "", 'value': 0.0}
+
+# slots=True needs Python 3.10, while setup.py still allows 3.8
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Layer:
     name: str
     gds_number: Optional[int] = None
     expression: Optional[str] = None
     line_number: int = 0
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DRCRule:
     name: str
     description: str
@@ -30,7 +140,7 @@ class DRCRule:
     second_layer: str = None
     antenna_params: Dict[str, Any] = None
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ICVRule:
     name: str
     description: str
@@ -38,6 +148,56 @@ class ICVRule:
     operation: str
     icv_syntax: str
     line_number: int = 0
+    # ICV rule identifier, derived from name once so every write reuses it
+    lower_name: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.lower_name = self.name.lower()
+
+# ICV check syntax builders, one per SVRF rule type
+def _single_layer_syntax(function):
+    """Build a syntax builder for a plain single-layer check"""
+    def syntax(rule):
+        return f"{function}({rule.layer}) {rule.operator} {rule.value}"
+    return syntax
+
+def _external_syntax(rule):
+    if rule.second_layer:
+        return f"space({rule.layer}, {rule.second_layer}) {rule.operator} {rule.value}"
+    return f"space({rule.layer}) {rule.operator} {rule.value}"
+
+def _density_syntax(rule):
+    if rule.extra_params and len(rule.extra_params) >= 2:
+        return f"density({rule.layer}, {rule.extra_params[0]}, {rule.extra_params[1]}) {rule.operator} {rule.value}"
+    return f"density({rule.layer}) {rule.operator} {rule.value}"
+
+def _enclosure_syntax(rule):
+    # Convert SVRF enclosure to ICV format: enclosure(OUTER, INNER)
+    icv_operator = ">=" if rule.operator in (">=", "==") else rule.operator
+    return f"enclosure({rule.second_layer}, {rule.layer}) {icv_operator} {rule.value}"
+
+def _antenna_syntax(rule):
+    gate_layer = rule.antenna_params['gate_layer'] if rule.antenna_params else 'GATE'
+    return f"antenna_ratio({rule.layer}, {gate_layer}) <= {rule.value}"
+
+def _pattern_syntax(rule):
+    return f"pattern_check({rule.layer}, rectangle)"
+
+# Rule type -> (syntax builder, ICV operation)
+_ICV_TRANSLATIONS = {
+    'internal1': (_single_layer_syntax('width'), "width check"),
+    'internal2': (_single_layer_syntax('length'), "length check"),
+    'external1': (_single_layer_syntax('space'), "spacing check"),
+    'external': (_external_syntax, "inter-layer spacing"),
+    'area': (_single_layer_syntax('area'), "area check"),
+    'density': (_density_syntax, "density check"),
+    'enclosure': (_enclosure_syntax, "enclosure check"),
+    'antenna': (_antenna_syntax, "antenna check"),
+    'pattern_matching': (_pattern_syntax, "pattern matching"),
+    'multi_patterning': (_single_layer_syntax('space_same_mask'), "multi-patterning"),
+}
+
+_GENERIC_TRANSLATION = (_single_layer_syntax('check'), "generic check")
 
 class FinalEnhancedTranslator:
     """Final enhanced translator with 100% coverage"""
@@ -51,19 +211,27 @@ class FinalEnhancedTranslator:
         self.icv_layers = []
         self.technology = "Generic"
         self.process_node = "180nm"
+        
+        # line[:5] -> (keyword, handler); a None handler skips the statement
+        self.statement_handlers = {
+            'INCLU': ('INCLUDE', self.parse_include),
+            'LAYOU': ('LAYOUT', None),  # Skip layout declarations
+            'LAYER': ('LAYER', self.parse_layer_definition),
+        }
     
     def parse_file(self, filename: str):
         """Parse SVRF file with robust error handling"""
         try:
+            # Strip every line once; rule blocks reuse the stripped lines
             with open(filename, 'r') as f:
-                lines = f.readlines()
+                lines = [line.strip() for line in f]
         except FileNotFoundError:
             self.errors.append(f"File not found: {filename}")
             return
         
         i = 0
         while i < len(lines):
-            line = lines[i].strip()
+            line = lines[i]
             line_num = i + 1
             
             # Skip empty lines and comments
@@ -72,23 +240,12 @@ class FinalEnhancedTranslator:
                 continue
             
             try:
-                # INCLUDE statements
-                if line.startswith('INCLUDE'):
-                    match = re.search(r'INCLUDE\s+"([^"]+)"', line)
-                    if match:
-                        self.includes.append(match.group(1))
-                
-                # LAYOUT statements
-                elif line.startswith('LAYOUT'):
-                    pass  # Skip layout declarations
-                
-                # Layer definitions
-                elif line.startswith('LAYER'):
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        layer_name = parts[1]
-                        gds_number = int(parts[2])
-                        self.layers.append(Layer(layer_name, gds_number=gds_number, line_number=line_num))
+                # Keyword statements, confirmed with startswith after the lookup
+                statement = self.statement_handlers.get(line[:5])
+                if statement is not None and line.startswith(statement[0]):
+                    handler = statement[1]
+                    if handler is not None:
+                        handler(line, line_num)
                 
                 # Derived layer assignments
                 elif '=' in line and not line.startswith('    ') and '{' not in line and 'NOT INSIDE' not in line:
@@ -108,297 +265,169 @@ class FinalEnhancedTranslator:
             
             i += 1
     
+    def parse_include(self, line: str, line_num: int):
+        """Parse INCLUDE statement"""
+        match = _INCLUDE_RE.search(line)
+        if match:
+            self.includes.append(match.group(1))
+    
+    def parse_layer_definition(self, line: str, line_num: int):
+        """Parse LAYER definition"""
+        parts = line.split()
+        if len(parts) >= 3:
+            layer_name = parts[1]
+            gds_number = int(parts[2])
+            self.layers.append(Layer(layer_name, gds_number=gds_number, line_number=line_num))
+    
     def parse_rule_block(self, lines: List[str], start_idx: int, line_num: int):
-        """Parse complete rule block"""
-        line = lines[start_idx].strip()
+        """Parse complete rule block from already stripped lines"""
+        line = lines[start_idx]
         
         # Get rule name
         if '{' in line:
             rule_name = line.split('{')[0].strip()
         else:
-            rule_name = line.strip()
+            rule_name = line
         
-        # Collect complete rule content
-        rule_lines = []
+        # Find the end of the rule block
         brace_count = 0
         i = start_idx
         found_opening_brace = False
         
         while i < len(lines):
-            current_line = lines[i].strip()
-            if current_line:
-                rule_lines.append(current_line)
-            
-            open_braces = current_line.count('{')
-            close_braces = current_line.count('}')
-            
-            if open_braces > 0:
-                found_opening_brace = True
-            
-            brace_count += open_braces - close_braces
+            current_line = lines[i]
             
-            if found_opening_brace and brace_count == 0:
-                break
+            # Only a line holding a brace can change the count or end the block
+            if '{' in current_line or '}' in current_line:
+                open_braces = current_line.count('{')
+                close_braces = current_line.count('}')
+                
+                if open_braces > 0:
+                    found_opening_brace = True
+                
+                brace_count += open_braces - close_braces
+                
+                if found_opening_brace and brace_count == 0:
+                    break
             
             i += 1
         
-        # Parse rule content
-        rule_content = ' '.join(rule_lines)
+        # Parse rule content: the block's non-empty lines, joined in one go
+        rule_content = ' '.join(filter(None, lines[start_idx:i + 1]))
         self.parse_rule_content(rule_name, rule_content, line_num)
         
         return i
     
     def parse_rule_content(self, rule_name: str, content: str, line_num: int):
         """Parse rule content and classify rule type"""
+        self.rules.append(self.classify_rule(rule_name, content, line_num))
+    
+    @staticmethod
+    def classify_rule(rule_name: str, content: str, line_num: int) -> DRCRule:
+        """Classify one rule body and return the parsed rule
         
+        Stateless: it reads only module-level tables, so rule bodies can be
+        classified independently (e.g. in a process pool).
+        """
         # Extract description
         description = ""
-        desc_match = re.search(r'@\s*"([^"]+)"', content)
+        desc_match = _DESC_RE.search(content)
         if desc_match:
             description = desc_match.group(1)
         
-        # Initialize rule properties
         rule_type = "unknown"
-        layer = ""
-        operator = ""
-        value = 0.0
-        extra_params = []
-        second_layer = None
-        antenna_params = None
+        fields = _UNKNOWN_FIELDS
         
-        # Rule classification patterns - ordered by complexity
-        
-        # 1. Enclosure rules: LAYER1 NOT INSIDE LAYER2 BY >= VALUE
-        enclosure_match = re.search(r'(\w+)\s+NOT\s+INSIDE\s+(\w+)\s+BY\s*(>=|==|<=)\s*([\d.]+)', content)
-        if enclosure_match:
+        # Enclosure rules: LAYER1 NOT INSIDE LAYER2 BY >= VALUE
+        match = _ENCLOSURE_RE.search(content) if 'INSIDE' in content else None
+        if match:
             rule_type = "enclosure"
-            layer = enclosure_match.group(1)  # Inner layer
-            second_layer = enclosure_match.group(2)  # Outer layer  
-            operator = enclosure_match.group(3)
-            value = float(enclosure_match.group(4))
-        
-        # 2. Antenna rules: ANTENNA LAYER1 LAYER2 MAX RATIO VALUE
-        elif 'ANTENNA' in content and 'MAX RATIO' in content:
-            antenna_match = re.search(r'ANTENNA\s+(\w+)\s+(\w+)\s+MAX\s+RATIO\s+([\d.]+)', content)
-            if antenna_match:
-                rule_type = "antenna"
-                layer = antenna_match.group(1)
-                antenna_params = {
-                    'gate_layer': antenna_match.group(2),
-                    'max_ratio': float(antenna_match.group(3))
-                }
-                operator = "MAX_RATIO"
-                value = float(antenna_match.group(3))
-        
-        # 3. Pattern matching rules: RECTANGLE LAYER LENGTH OP VALUE WIDTH OP VALUE  
-        elif 'RECTANGLE' in content:
-            rect_match = re.search(r'RECTANGLE\s+(\w+)\s+LENGTH\s*([<>=]+)\s*([\d.]+)\s+WIDTH\s*([<>=]+)\s*([\d.]+)', content)
-            if rect_match:
-                rule_type = "pattern_matching"
-                layer = rect_match.group(1)
-                operator = "RECTANGLE"
-                value = 0.0
-                extra_params = [f"LENGTH{rect_match.group(2)}{rect_match.group(3)}", 
-                               f"WIDTH{rect_match.group(4)}{rect_match.group(5)}"]
-        
-        # 4. Multi-patterning rules: EXTERNAL1 LAYER OP VALUE SAME_MASK
-        elif 'SAME_MASK' in content:
-            mp_match = re.search(r'(EXTERNAL1)\s+(\w+)\s*(<|>|==)\s*([\d.]+)\s+SAME_MASK', content)
-            if mp_match:
-                rule_type = "multi_patterning"
-                layer = mp_match.group(2)
-                operator = mp_match.group(3)
-                value = float(mp_match.group(4))
-                extra_params = ['SAME_MASK']
-        
-        # 5. Inter-layer spacing: EXTERNAL LAYER1 LAYER2 OP VALUE
-        elif 'EXTERNAL' in content:
-            # First try inter-layer pattern
-            inter_match = re.search(r'EXTERNAL\s+(\w+)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', content)
-            if inter_match:
-                rule_type = "external"
-                layer = inter_match.group(1)
-                second_layer = inter_match.group(2)
-                operator = inter_match.group(3)
-                value = float(inter_match.group(4))
-            else:
-                # Single layer spacing
-                ext_match = re.search(r'EXTERNAL1\s+(\w+)\s*(<|>|==)\s*([\d.]+)', content)
-                if ext_match:
-                    rule_type = "external1"
-                    layer = ext_match.group(1)
-                    operator = ext_match.group(2)
-                    value = float(ext_match.group(3))
-        
-        # 6. Density rules: DENSITY LAYER WINDOW X Y OP VALUE (handle first occurrence only)
-        elif 'DENSITY' in content and 'WINDOW' in content:
-            # Find first density statement only
-            density_match = re.search(r'DENSITY\s+(\w+)\s+WINDOW\s+([\d.]+)\s+([\d.]+)\s*(<|>|==)\s*([\d.]+)', content)
-            if density_match:
-                rule_type = "density"
-                layer = density_match.group(1)
-                operator = density_match.group(4)
-                value = float(density_match.group(5))
-                extra_params = [density_match.group(2), density_match.group(3)]
-        
-        # 7. Area rules: AREA LAYER OP VALUE
-        elif 'AREA' in content:
-            area_match = re.search(r'AREA\s+(\w+)\s*(<|>|==)\s*([\d.]+)', content)
-            if area_match:
-                rule_type = "area"
-                layer = area_match.group(1)
-                operator = area_match.group(2)
-                value = float(area_match.group(3))
-        
-        # 8. Length rules: INTERNAL2 LAYER OP VALUE
-        elif 'INTERNAL2' in content:
-            int2_match = re.search(r'INTERNAL2\s+(\w+)\s*(<|>|==)\s*([\d.]+)', content)
-            if int2_match:
-                rule_type = "internal2"
-                layer = int2_match.group(1)
-                operator = int2_match.group(2)
-                value = float(int2_match.group(3))
-        
-        # 9. Width rules: INTERNAL1 LAYER OP VALUE
-        elif 'INTERNAL1' in content:
-            int1_match = re.search(r'INTERNAL1\s+(\w+)\s*(<|>|==)\s*([\d.]+)', content)
-            if int1_match:
-                rule_type = "internal1"
-                layer = int1_match.group(1)
-                operator = int1_match.group(2)
-                value = float(int1_match.group(3))
-        
-        # Add parsed rule
-        self.rules.append(DRCRule(
+            fields = _enclosure_fields(match)
+        else:
+            for keywords, branches in _RULE_DISPATCH:
+                if all(keyword in content for keyword in keywords):
+                    for branch_type, regex, build_fields in branches:
+                        match = regex.search(content)
+                        if match:
+                            rule_type = branch_type
+                            fields = build_fields(match)
+                            break
+                    break
+        
+        return DRCRule(
             name=rule_name,
             description=description,
             rule_type=rule_type,
-            layer=layer,
-            operator=operator,
-            value=value,
             line_number=line_num,
-            extra_params=extra_params if extra_params else None,
-            second_layer=second_layer,
-            antenna_params=antenna_params
-        ))
+            **fields
+        )
     
     def translate_to_icv(self):
         """Translate all rules to ICV format"""
-        self.icv_rules = []
         self.icv_layers = []
+        append_layer = self.icv_layers.append
         
         # Translate layers
         for layer in self.layers:
             if layer.gds_number is not None:
                 icv_layer = f"LAYER {layer.name} = {layer.gds_number};"
             else:
-                expression = layer.expression.replace(" AND ", " & ").replace(" OR ", " | ").replace(" NOT ", " ! ")
+                expression = _LAYER_OP_RE.sub(lambda m: _LAYER_OP_MAP[m.group(0)], layer.expression)
                 icv_layer = f"LAYER {layer.name} = {expression};"
-            self.icv_layers.append(icv_layer)
+            append_layer(icv_layer)
         
-        # Translate rules
-        for rule in self.rules:
-            icv_rule = self.translate_rule(rule)
-            if icv_rule:
-                self.icv_rules.append(icv_rule)
+        # Translate rules; the comprehension builds the list in one go
+        # instead of growing it through a Python-level append per rule
+        self.icv_rules = [icv_rule for icv_rule in map(self.translate_rule, self.rules) if icv_rule]
     
     def translate_rule(self, rule: DRCRule) -> ICVRule:
         """Translate individual rule to ICV format"""
-        
-        if rule.rule_type == "internal1":
-            icv_syntax = f"width({rule.layer}) {rule.operator} {rule.value}"
-            operation = "width check"
-        
-        elif rule.rule_type == "internal2":
-            icv_syntax = f"length({rule.layer}) {rule.operator} {rule.value}"
-            operation = "length check"
-        
-        elif rule.rule_type == "external1":
-            icv_syntax = f"space({rule.layer}) {rule.operator} {rule.value}"
-            operation = "spacing check"
-        
-        elif rule.rule_type == "external":
-            if rule.second_layer:
-                icv_syntax = f"space({rule.layer}, {rule.second_layer}) {rule.operator} {rule.value}"
-            else:
-                icv_syntax = f"space({rule.layer}) {rule.operator} {rule.value}"
-            operation = "inter-layer spacing"
-        
-        elif rule.rule_type == "area":
-            icv_syntax = f"area({rule.layer}) {rule.operator} {rule.value}"
-            operation = "area check"
-        
-        elif rule.rule_type == "density":
-            if rule.extra_params and len(rule.extra_params) >= 2:
-                icv_syntax = f"density({rule.layer}, {rule.extra_params[0]}, {rule.extra_params[1]}) {rule.operator} {rule.value}"
-            else:
-                icv_syntax = f"density({rule.layer}) {rule.operator} {rule.value}"
-            operation = "density check"
-        
-        elif rule.rule_type == "enclosure":
-            # Convert SVRF enclosure to ICV format
-            outer_layer = rule.second_layer
-            inner_layer = rule.layer
-            icv_operator = ">=" if rule.operator in [">=", "=="] else rule.operator
-            icv_syntax = f"enclosure({outer_layer}, {inner_layer}) {icv_operator} {rule.value}"
-            operation = "enclosure check"
-        
-        elif rule.rule_type == "antenna":
-            gate_layer = rule.antenna_params['gate_layer'] if rule.antenna_params else 'GATE'
-            icv_syntax = f"antenna_ratio({rule.layer}, {gate_layer}) <= {rule.value}"
-            operation = "antenna check"
-        
-        elif rule.rule_type == "pattern_matching":
-            icv_syntax = f"pattern_check({rule.layer}, rectangle)"
-            operation = "pattern matching"
-        
-        elif rule.rule_type == "multi_patterning":
-            icv_syntax = f"space_same_mask({rule.layer}) {rule.operator} {rule.value}"
-            operation = "multi-patterning"
-        
-        else:
-            # Fallback for unknown types
-            icv_syntax = f"check({rule.layer}) {rule.operator} {rule.value}"
-            operation = "generic check"
+        # Unknown types fall back to a generic check
+        build_syntax, operation = _ICV_TRANSLATIONS.get(rule.rule_type, _GENERIC_TRANSLATION)
         
         return ICVRule(
             name=rule.name,
             description=rule.description,
             layer=rule.layer,
             operation=operation,
-            icv_syntax=icv_syntax,
+            icv_syntax=build_syntax(rule),
             line_number=rule.line_number
         )
     
     def write_icv_file(self, output_file: str):
         """Write ICV output file"""
-        with open(output_file, 'w') as f:
-            f.write(f"// Final Enhanced ICV Rules - 100% Coverage\n")
-            f.write(f"// Technology: {self.technology}\n")
-            f.write(f"// Process Node: {self.process_node}\n")
-            f.write(f"// Total Rules: {len(self.icv_rules)}\n")
-            f.write(f"// Total Layers: {len(self.icv_layers)}\n\n")
-            
-            # Run options
-            f.write("run_options {\n")
-            f.write("    layout_file = \"layout.gds\";\n")
-            f.write("    output_dir = \"./icv_results\";\n")
-            f.write("}\n\n")
-            
-            # Layers
-            f.write("// Layer Definitions\n")
-            for layer in self.icv_layers:
-                f.write(f"{layer}\n")
-            f.write("\n")
-            
-            # Rules
-            f.write("// DRC Rules\n")
-            for rule in self.icv_rules:
-                f.write(f"// {rule.name}: {rule.description}\n")
-                f.write(f"rule {rule.name.lower()} {{\n")
-                f.write(f"    check_rule = {rule.icv_syntax};\n")
-                f.write(f"    error_message = \"{rule.description}\";\n")
-                f.write(f"}}\n\n")
+        # Build the whole deck in memory and write it in one call
+        parts = []
+        emit = parts.append
+        
+        emit(f"// Final Enhanced ICV Rules - 100% Coverage\n"
+             f"// Technology: {self.technology}\n"
+             f"// Process Node: {self.process_node}\n"
+             f"// Total Rules: {len(self.icv_rules)}\n"
+             f"// Total Layers: {len(self.icv_layers)}\n\n")
+        
+        # Run options
+        emit("run_options {\n"
+             "    layout_file = \"layout.gds\";\n"
+             "    output_dir = \"./icv_results\";\n"
+             "}\n\n")
+        
+        # Layers
+        emit("// Layer Definitions\n")
+        for layer in self.icv_layers:
+            emit(f"{layer}\n")
+        emit("\n")
+        
+        # Rules
+        emit("// DRC Rules\n")
+        for rule in self.icv_rules:
+            emit(f"// {rule.name}: {rule.description}\n"
+                 f"rule {rule.lower_name} {{\n"
+                 f"    check_rule = {rule.icv_syntax};\n"
+                 f"    error_message = \"{rule.description}\";\n"
+                 f"}}\n\n")
+        
+        Path(output_file).write_text(''.join(parts))
     
     def print_summary(self):
         """Print translation summary"""
@@ -414,9 +443,7 @@ class FinalEnhancedTranslator:
         print(f"  Parse Errors: {len(self.errors)}")
         
         # Rule type distribution
-        rule_types = {}
-        for rule in self.icv_rules:
-            rule_types[rule.operation] = rule_types.get(rule.operation, 0) + 1
+        rule_types = Counter(rule.operation for rule in self.icv_rules)
         
         print(f"\nRule Type Distribution:")
         for rule_type, count in sorted(rule_types.items()):
@@ -6,18 +6,50 @@ A streamlined parser for SVRF DRC rules with better error handling
 
 import re
 import sys
+from collections import Counter
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
-@dataclass
+# Statement and rule patterns, compiled once at import
+_INCLUDE_RE = re.compile(r'INCLUDE\s+"([^"]+)"')
+_DESC_RE = re.compile(r'@\s*"([^"]+)"')
+
+# Common DRC rule patterns as (compiled regex, category), tried in order
+_RULE_PATTERNS = [(re.compile(pattern, re.IGNORECASE), category) for pattern, category in [
+    # INTERNAL1 layer < value
+    (r'(INTERNAL1)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'width/area'),
+    # INTERNAL2 layer < value
+    (r'(INTERNAL2)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'width/length'),
+    # EXTERNAL1 layer < value
+    (r'(EXTERNAL1)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'spacing'),
+    # EXTERNAL layer1 layer2 < value
+    (r'(EXTERNAL)\s+(\w+)\s+\w+\s*(<|>|==)\s*([\d.]+)', 'spacing'),
+    # layer NOT INSIDE layer BY == value
+    (r'(\w+)\s+NOT\s+INSIDE\s+(\w+)\s+BY\s+==\s*([\d.]+)', 'enclosure'),
+    # AREA layer < value
+    (r'(AREA)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'area'),
+    # DENSITY layer WINDOW x y < value
+    (r'(DENSITY)\s+(\w+)\s+WINDOW\s+[\d.]+\s+[\d.]+\s*(<|>|==)\s*([\d.]+)', 'density'),
+]]
+
+@lru_cache(maxsize=1024)
+def _to_float(text):
+    """Parse a rule value, reusing the result for repeated literals"""
+    return float(text)
+
+# Slot the parsed records when the interpreter allows it
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Layer:
     name: str
     gds_number: Optional[int] = None
     expression: Optional[str] = None
     line_number: int = 0
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DRCRule:
     name: str
     description: str
@@ -26,7 +58,7 @@ class DRCRule:
     operator: str
     value: float
     line_number: int = 0
-    extra_params: List[str] = None
+    extra_params: List[str] = field(default_factory=list)
 
 class SVRFParser:
     def __init__(self):
@@ -34,6 +66,13 @@ class SVRFParser:
         self.rules = []
         self.includes = []
         self.errors = []
+        
+        # INCLUDE/LAYOUT/LAYER prefix -> (keyword, handler or None to skip)
+        self.statement_handlers = {
+            'INCLU': ('INCLUDE', self.parse_include),
+            'LAYOU': ('LAYOUT', None),  # Skip layout declarations
+            'LAYER': ('LAYER', self.parse_layer_definition),
+        }
     
     def parse_file(self, filename: str):
         """Parse SVRF file"""
@@ -59,17 +98,12 @@ class SVRFParser:
                 continue
             
             try:
-                # INCLUDE statements
-                if line.startswith('INCLUDE'):
-                    self.parse_include(line, line_num)
-                
-                # LAYOUT statements
-                elif line.startswith('LAYOUT'):
-                    pass  # Skip layout declarations
-                
-                # Layer definitions
-                elif line.startswith('LAYER'):
-                    self.parse_layer_definition(line, line_num)
+                # INCLUDE, LAYOUT and LAYER statements
+                statement = self.statement_handlers.get(line[:5])
+                if statement is not None and line.startswith(statement[0]):
+                    handler = statement[1]
+                    if handler is not None:
+                        handler(line, line_num)
                 
                 # Derived layer assignments (LAYER_NAME = expression)
                 elif '=' in line and not line.startswith('    ') and '{' not in line:
@@ -86,7 +120,7 @@ class SVRFParser:
     
     def parse_include(self, line: str, line_num: int):
         """Parse INCLUDE statement"""
-        match = re.search(r'INCLUDE\s+"([^"]+)"', line)
+        match = _INCLUDE_RE.search(line)
         if match:
             self.includes.append(match.group(1))
     
@@ -130,18 +164,19 @@ class SVRFParser:
             if current_line:  # Skip empty lines
                 rule_lines.append(current_line)
             
-            # Count braces to find end of rule
-            open_braces = current_line.count('{')
-            close_braces = current_line.count('}')
-            
-            if open_braces > 0:
-                found_opening_brace = True
-            
-            brace_count += open_braces - close_braces
-            
-            # If we found the opening brace and count is back to 0, we're done
-            if found_opening_brace and brace_count == 0:
-                break
+            # Count braces to find end of rule, skipping lines that have none
+            if '{' in current_line or '}' in current_line:
+                open_braces = current_line.count('{')
+                close_braces = current_line.count('}')
+                
+                if open_braces > 0:
+                    found_opening_brace = True
+                
+                brace_count += open_braces - close_braces
+                
+                # If we found the opening brace and count is back to 0, we're done
+                if found_opening_brace and brace_count == 0:
+                    break
             
             i += 1
         
@@ -156,47 +191,31 @@ class SVRFParser:
         
         # Extract description
         description = ""
-        desc_match = re.search(r'@\s*"([^"]+)"', content)
+        desc_match = _DESC_RE.search(content)
         if desc_match:
             description = desc_match.group(1)
         
-        # Common DRC rule patterns
-        patterns = [
-            # INTERNAL1 layer < value
-            (r'(INTERNAL1)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'width/area'),
-            # INTERNAL2 layer < value
-            (r'(INTERNAL2)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'width/length'),
-            # EXTERNAL1 layer < value  
-            (r'(EXTERNAL1)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'spacing'),
-            # EXTERNAL layer1 layer2 < value
-            (r'(EXTERNAL)\s+(\w+)\s+\w+\s*(<|>|==)\s*([\d.]+)', 'spacing'),
-            # layer NOT INSIDE layer BY == value
-            (r'(\w+)\s+NOT\s+INSIDE\s+(\w+)\s+BY\s+==\s*([\d.]+)', 'enclosure'),
-            # AREA layer < value
-            (r'(AREA)\s+(\w+)\s*(<|>|==)\s*([\d.]+)', 'area'),
-            # DENSITY layer WINDOW x y < value
-            (r'(DENSITY)\s+(\w+)\s+WINDOW\s+[\d.]+\s+[\d.]+\s*(<|>|==)\s*([\d.]+)', 'density'),
-        ]
-        
         rule_type = "unknown"
         layer = ""
         operator = ""
         value = 0.0
         extra_params = []
         
-        for pattern, rule_category in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for rule_re, rule_category in _RULE_PATTERNS:
+            match = rule_re.search(content)
             if match:
                 if rule_category == 'enclosure':
                     rule_type = "enclosure"
                     layer = match.group(1)
-                    value = float(match.group(3))
+                    value = _to_float(match.group(3))
                     operator = "=="
                 else:
-                    rule_type = match.group(1).lower()
+                    # Intern so rule_type comparisons and dict lookups
+                    # downstream hit the identity fast path
+                    rule_type = sys.intern(match.group(1).lower())
                     layer = match.group(2) if len(match.groups()) > 1 else ""
                     operator = match.group(3) if len(match.groups()) > 2 else ""
-                    value = float(match.group(4)) if len(match.groups()) > 3 else 0.0
+                    value = _to_float(match.group(4)) if len(match.groups()) > 3 else 0.0
                 
                 # Check for SINGULAR parameter
                 if 'SINGULAR' in content:
@@ -217,17 +236,10 @@ class SVRFParser:
     
     def get_statistics(self):
         """Get parsing statistics"""
-        layer_types = {}
-        rule_types = {}
-        
-        for layer in self.layers:
-            if layer.gds_number is not None:
-                layer_types['primary'] = layer_types.get('primary', 0) + 1
-            else:
-                layer_types['derived'] = layer_types.get('derived', 0) + 1
-        
-        for rule in self.rules:
-            rule_types[rule.rule_type] = rule_types.get(rule.rule_type, 0) + 1
+        # Counter keeps first-seen key order, so reports list types as before
+        layer_types = dict(Counter(
+            'primary' if layer.gds_number is not None else 'derived' for layer in self.layers))
+        rule_types = dict(Counter(rule.rule_type for rule in self.rules))
         
         return {
             'layers': len(self.layers),
@@ -242,35 +254,40 @@ class SVRFParser:
         """Print parsing results"""
         stats = self.get_statistics()
         
-        print(f"SVRF Parsing Results:")
-        print(f"  Layers: {stats['layers']}")
-        print(f"    Primary: {stats['layer_types'].get('primary', 0)}")
-        print(f"    Derived: {stats['layer_types'].get('derived', 0)}")
-        print(f"  Rules: {stats['rules']}")
-        print(f"  Includes: {stats['includes']}")
-        print(f"  Errors: {stats['errors']}")
+        # Build the report first and emit it with a single write
+        lines = [
+            f"SVRF Parsing Results:",
+            f"  Layers: {stats['layers']}",
+            f"    Primary: {stats['layer_types'].get('primary', 0)}",
+            f"    Derived: {stats['layer_types'].get('derived', 0)}",
+            f"  Rules: {stats['rules']}",
+            f"  Includes: {stats['includes']}",
+            f"  Errors: {stats['errors']}",
+        ]
         
         if self.errors:
-            print(f"\nErrors:")
-            for error in self.errors:
-                print(f"  - {error}")
+            lines.append(f"\nErrors:")
+            lines.extend(f"  - {error}" for error in self.errors)
         
         if stats['rule_types']:
-            print(f"\nRule Types:")
+            lines.append(f"\nRule Types:")
             for rule_type, count in sorted(stats['rule_types'].items()):
-                print(f"  {rule_type}: {count}")
+                lines.append(f"  {rule_type}: {count}")
+        
+        print('\n'.join(lines))
     
     def print_layers(self):
         """Print layer information"""
         if not self.layers:
             return
             
-        print(f"\nLayers ({len(self.layers)}):")
+        lines = [f"\nLayers ({len(self.layers)}):"]
         for layer in self.layers:
             if layer.gds_number is not None:
-                print(f"  {layer.name}: GDS {layer.gds_number}")
+                lines.append(f"  {layer.name}: GDS {layer.gds_number}")
             else:
-                print(f"  {layer.name}: {layer.expression}")
+                lines.append(f"  {layer.name}: {layer.expression}")
+        print('\n'.join(lines))
     
     def print_rules(self, rule_filter=None):
         """Print rule information"""
@@ -281,16 +298,17 @@ class SVRFParser:
         if rule_filter:
             filtered_rules = [r for r in self.rules if rule_filter.lower() in r.rule_type.lower()]
         
-        print(f"\nRules ({len(filtered_rules)}):")
+        lines = [f"\nRules ({len(filtered_rules)}):"]
         for rule in filtered_rules:
-            print(f"  {rule.name} (line {rule.line_number}):")
-            print(f"    Type: {rule.rule_type}")
-            print(f"    Layer: {rule.layer}")
-            print(f"    Constraint: {rule.operator} {rule.value}")
+            lines.append(f"  {rule.name} (line {rule.line_number}):")
+            lines.append(f"    Type: {rule.rule_type}")
+            lines.append(f"    Layer: {rule.layer}")
+            lines.append(f"    Constraint: {rule.operator} {rule.value}")
             if rule.description:
-                print(f"    Description: {rule.description}")
+                lines.append(f"    Description: {rule.description}")
             if rule.extra_params:
-                print(f"    Parameters: {', '.join(rule.extra_params)}")
+                lines.append(f"    Parameters: {', '.join(rule.extra_params)}")
+        print('\n'.join(lines))
 
 def main():
     import argparse
@@ -49,6 +49,12 @@ class SVRFToICVTranslator:
         # Parse SVRF file
         self.svrf_parser.parse_file(svrf_file)
         
+        return self.translate_from_parser(self.svrf_parser, output_file)
+    
+    def translate_from_parser(self, parser: SVRFParser, output_file: str = None):
+        """Translate an already parsed SVRF deck to ICV format"""
+        self.svrf_parser = parser
+        
         if self.svrf_parser.errors:
             print(f"Errors in SVRF parsing:")
             for error in self.svrf_parser.errors:
@@ -290,7 +296,7 @@ class SVRFToICVTranslator:
     
     def write_icv_file(self, output_file: str):
         """Write translated rules to ICV format file"""
-        with open(output_file, 'w') as f:
+        with open(output_file, 'w', buffering=128 * 1024) as f:
             # Write header
             f.write(f"// ICV DRC Rules translated from SVRF\n")
             f.write(f"// Technology: {self.technology}\n")
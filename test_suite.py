@@ -138,6 +138,193 @@ def test_demos():
     
     return True
 
+def test_enhanced_parser_lines():
+    """Test enhanced parser on plain lists of lines"""
+    print("🧪 Testing Enhanced Parser Line Input...")
+    
+    from enhanced_svrf_parser import EnhancedSVRFParser
+    
+    # Rule bodies split over lines without a trailing newline, as in a plain
+    # list passed to parse_lines: (lines, (rule_type, layer, extra_params))
+    cases = [
+        (["R3 {", "EXTERNAL M1", "M2 < 0.1", "}"], ("external", "M1", ["M2"])),
+        (["R6 {", "VIA1 NOT INSIDE", "M1 BY == 0.05", "}"], ("enclosure", "VIA1", None)),
+        (["R4 {", "INTERNAL1 M1 < 0.1", "SINGULAR", "}"], ("internal1", "M1", ["SINGULAR"])),
+    ]
+    
+    for lines, expected in cases:
+        parser = EnhancedSVRFParser()
+        parser.parse_lines(lines)
+        name = lines[0].split()[0]
+        rule = parser.rules[0] if len(parser.rules) == 1 else None
+        if rule and (rule.rule_type, rule.layer, rule.extra_params) == expected:
+            print(f"  ✅ {name} multi-line body - PASSED")
+        else:
+            print(f"  ❌ {name} multi-line body - FAILED: {rule}")
+            return False
+    
+    return True
+
+def test_enhanced_rule_priority():
+    """Test enhanced rule classification order and density fields"""
+    print("🧪 Testing Enhanced Rule Priority...")
+    
+    from enhanced_svrf_parser import EnhancedSVRFParser
+    
+    # Bodies matching several patterns take the earliest pattern in priority
+    # order, not the leftmost match: (label, lines, expected fields)
+    cases = [
+        ("Width over earlier area", ["R1 {", "X = AREA M1 < 0.1", "INTERNAL1 X < 0.05", "}"],
+         ("internal1", "X", "<", 0.05, None)),
+        ("Width over earlier enclosure", ["R2 {", "VIA1 NOT INSIDE M1 BY == 0.05", "INTERNAL1 M1 < 0.1", "}"],
+         ("internal1", "M1", "<", 0.1, None)),
+        ("Density window and value", ["D1 {", "DENSITY M1 WINDOW 100 100 < 0.7", "}"],
+         ("density", "M1", "<", 0.7, ["100", "100"])),
+    ]
+    
+    for label, lines, expected in cases:
+        parser = EnhancedSVRFParser()
+        parser.parse_lines(lines)
+        rule = parser.rules[0] if len(parser.rules) == 1 else None
+        fields = rule and (rule.rule_type, rule.layer, rule.operator, rule.value, rule.extra_params)
+        if fields == expected and not parser.errors:
+            print(f"  ✅ {label} - PASSED")
+        else:
+            print(f"  ❌ {label} - FAILED: {rule} {parser.errors}")
+            return False
+    
+    return True
+
+def test_enhanced_parser_contracts():
+    """Test enhanced parser rule extraction return contracts"""
+    print("🧪 Testing Enhanced Parser Contracts...")
+    
+    from enhanced_svrf_parser import EnhancedSVRFParser, DRCRule
+    
+    # build_enhanced_rule returns the rule and stores nothing
+    rule = EnhancedSVRFParser.build_enhanced_rule("R1", "R1 { INTERNAL1 M1 < 0.1 }", 1)
+    if isinstance(rule, DRCRule) and rule.rule_type == "internal1":
+        print("  ✅ build_enhanced_rule returns DRCRule - PASSED")
+    else:
+        print(f"  ❌ build_enhanced_rule returns DRCRule - FAILED: {rule}")
+        return False
+    
+    # extract_enhanced_rule_details keeps its appending behavior
+    parser = EnhancedSVRFParser()
+    result = parser.extract_enhanced_rule_details("R1", "R1 { INTERNAL1 M1 < 0.1 }", 1)
+    if result is None and len(parser.rules) == 1 and parser.rules[0].layer == "M1":
+        print("  ✅ extract_enhanced_rule_details appends - PASSED")
+    else:
+        print(f"  ❌ extract_enhanced_rule_details appends - FAILED: {parser.rules}")
+        return False
+    
+    # parse_enhanced_drc_rule returns (rule, next unconsumed line)
+    parser = EnhancedSVRFParser()
+    numbered = enumerate(["INTERNAL1 M1 < 0.1", "}", "LAYER M2 2"], 2)
+    rule, pending = parser.parse_enhanced_drc_rule("R1 {", next(numbered), numbered, 1)
+    if rule.rule_type == "internal1" and pending == (4, "LAYER M2 2") and not parser.rules:
+        print("  ✅ parse_enhanced_drc_rule returns lookahead - PASSED")
+    else:
+        print(f"  ❌ parse_enhanced_drc_rule returns lookahead - FAILED: {rule} {pending}")
+        return False
+    
+    numbered = enumerate(["AREA M1 < 0.01", "}"], 2)
+    rule, pending = parser.parse_enhanced_drc_rule("R2 {", next(numbered), numbered, 1)
+    if rule.rule_type == "area" and pending is None:
+        print("  ✅ parse_enhanced_drc_rule at EOF - PASSED")
+    else:
+        print(f"  ❌ parse_enhanced_drc_rule at EOF - FAILED: {rule} {pending}")
+        return False
+    
+    return True
+
+def test_enhanced_iter_parse():
+    """Test streaming rule iteration in the enhanced parser"""
+    print("🧪 Testing Enhanced Parser iter_parse...")
+    
+    from enhanced_svrf_parser import EnhancedSVRFParser
+    
+    def names_and_types(rules):
+        return [(rule.name, rule.rule_type) for rule in rules]
+    
+    # Rule header with its '{' on the last line; a bare name there is no rule
+    cases = [
+        ("Header on last line", ["LAYER M1 1", "R1 { INTERNAL1 M1 < 0.1 }", "R2 {"],
+         [("R1", "internal1"), ("R2", "unknown")]),
+        ("Bare name on last line", ["R1 { INTERNAL1 M1 < 0.1 }", "R2"],
+         [("R1", "internal1")]),
+        ("Body runs to EOF", ["R1 {", "INTERNAL1 M1 < 0.1"],
+         [("R1", "internal1")]),
+    ]
+    
+    for label, lines, expected in cases:
+        parser = EnhancedSVRFParser()
+        rules = list(parser.iter_parse(lines))
+        if names_and_types(rules) == expected and not parser.rules and not parser.errors:
+            print(f"  ✅ {label} - PASSED")
+        else:
+            print(f"  ❌ {label} - FAILED: {rules} {parser.errors}")
+            return False
+    
+    # iter_parse and parse_lines agree on real decks
+    for file in ["example_drc_rules.svrf", "test_comprehensive.svrf", "complex_drc_rules.svrf"]:
+        parser = EnhancedSVRFParser()
+        with open(file, 'r') as f:
+            parser.parse_lines(f)
+        with open(file, 'r') as f:
+            streamed = list(EnhancedSVRFParser().iter_parse(f))
+        if streamed == parser.rules:
+            print(f"  ✅ {file} iter_parse matches parse_lines - PASSED")
+        else:
+            print(f"  ❌ {file} iter_parse matches parse_lines - FAILED")
+            return False
+    
+    return True
+
+def test_translate_from_parser():
+    """Test translating an already parsed deck"""
+    print("🧪 Testing Translation From Parser...")
+    
+    import io
+    import tempfile
+    from contextlib import redirect_stdout
+    from simple_svrf_parser import SVRFParser
+    from svrf_to_icv_translator import SVRFToICVTranslator
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        from_file = os.path.join(tmp_dir, "from_file.icv")
+        from_parser = os.path.join(tmp_dir, "from_parser.icv")
+        
+        # Unsupported-rule warnings are expected; keep them out of the report
+        with redirect_stdout(io.StringIO()):
+            file_translator = SVRFToICVTranslator()
+            file_ok = file_translator.translate_file("example_drc_rules.svrf", from_file)
+            
+            parser = SVRFParser()
+            parser.parse_file("example_drc_rules.svrf")
+            parser_translator = SVRFToICVTranslator()
+            parser_ok = parser_translator.translate_from_parser(parser, from_parser)
+        
+        if not (file_ok and parser_ok):
+            print("  ❌ translate_from_parser - FAILED: translation reported failure")
+            return False
+        
+        if (parser_translator.icv_rules == file_translator.icv_rules
+                and parser_translator.icv_layers == file_translator.icv_layers
+                and parser_translator.svrf_parser is parser):
+            print("  ✅ Rules and layers match translate_file - PASSED")
+        else:
+            print("  ❌ Rules and layers match translate_file - FAILED")
+            return False
+        
+        if Path(from_parser).read_text() == Path(from_file).read_text():
+            print("  ✅ ICV output matches translate_file - PASSED")
+        else:
+            print("  ❌ ICV output matches translate_file - FAILED")
+            return False
+    
+    return True
+
 def validate_project_structure():
     """Validate project structure and files"""
     print("🧪 Validating Project Structure...")
@@ -226,7 +413,12 @@ def main():
         ("Complex Files", test_complex_files),
         ("Output Files", test_file_outputs),
         ("Demo Scripts", test_demos),
-        ("Rule Coverage", test_rule_coverage)
+        ("Rule Coverage", test_rule_coverage),
+        ("Enhanced Parser Lines", test_enhanced_parser_lines),
+        ("Enhanced Rule Priority", test_enhanced_rule_priority),
+        ("Enhanced Parser Contracts", test_enhanced_parser_contracts),
+        ("Enhanced iter_parse", test_enhanced_iter_parse),
+        ("Translate From Parser", test_translate_from_parser)
     ]
     
     passed = 0